@@ -0,0 +1,8 @@
+"""Python pipeline that builds company profiles from OpenRouter completions.
+
+Each section (``core``, ``jobs``, ``news``, ``tech``, ``culture``, ``ways``
+and ``interview``) has a prompt template in ``prompts/templates.json``,
+shared with the app, and a module here that prints it; ``parsing.sections``
+turns a template into a parsed dict and ``parsing.engine`` fetches all of
+them for a company at once.
+"""
@@ -0,0 +1,326 @@
+"""Append-only, compressed archive of every raw OpenRouter completion.
+
+Each successful completion is appended, with its model, labels, usage and
+template version, to a segment log under ``ARCHIVE_DIR``. A record is one
+frame: a big-endian length and CRC32 followed by the zlib-compressed JSON.
+Records are compressed against a preset dictionary built from the prompt
+templates, so the section keys and boilerplate cost almost nothing; the
+dictionary a segment was written with is named in the segment header and
+kept next to it. An SQLite index maps each record to its segment and
+offset, so records can be read back in bulk or one at a time. Replaying
+the archive runs the current extractor over old completions, so parser
+fixes apply retroactively without new API calls:
+
+    python -m parsing.archive stats
+    python -m parsing.archive replay --section jobs --update-cache
+    python -m parsing.archive dump raw.jsonl        # input for parsing.reprocess
+    python -m parsing.archive show 1234
+
+Set ``INSIDER_ARCHIVE=0`` to stop archiving. zstandard is not a dependency,
+so frames use the standard library's zlib.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+
+from parsing import templates
+from parsing.cache import CACHE_DIR
+
+ARCHIVE_DIR = os.environ.get("INSIDER_ARCHIVE_DIR", os.path.join(CACHE_DIR, "archive"))
+ARCHIVE_ENABLED = os.environ.get("INSIDER_ARCHIVE", "1") != "0"
+SEGMENT_BYTES = 64 << 20
+COMPRESSION_LEVEL = 6
+MAGIC = b"INSIDER-ARCHIVE-1"
+FRAME = struct.Struct(">II")
+ZDICT_BYTES = 32 << 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    dictionary TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    company TEXT,
+    section TEXT,
+    kind TEXT,
+    model TEXT,
+    template_version TEXT,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_section ON records (section, ts);
+CREATE INDEX IF NOT EXISTS records_company ON records (company, section);
+"""
+
+
+def build_dictionary():
+    """Preset zlib dictionary from the current prompt templates."""
+    from parsing.sections import SECTIONS
+
+    text = "".join(templates.render(section, "") for section in SECTIONS)
+    return text.encode("utf-8")[-ZDICT_BYTES:]
+
+
+class ArchiveError(Exception):
+    """A segment or frame that cannot be read back."""
+
+
+class ResponseArchive:
+    """Segment log plus offset index; appends are safe across threads and processes."""
+
+    def __init__(self, directory=ARCHIVE_DIR, segment_bytes=SEGMENT_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(directory, "index.sqlite3"), timeout=30,
+                                   check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._dictionaries = {}
+        self._dictionary = build_dictionary()
+        self._dictionary_id = hashlib.sha256(self._dictionary).hexdigest()[:12]
+        path = self._dictionary_path(self._dictionary_id)
+        if not os.path.exists(path):
+            with open(path + ".tmp", "wb") as f:
+                f.write(self._dictionary)
+            os.replace(path + ".tmp", path)
+
+    def _dictionary_path(self, dictionary_id):
+        return os.path.join(self.directory, f"dict-{dictionary_id}.zdict")
+
+    def _load_dictionary(self, dictionary_id):
+        if dictionary_id not in self._dictionaries:
+            with open(self._dictionary_path(dictionary_id), "rb") as f:
+                self._dictionaries[dictionary_id] = f.read()
+        return self._dictionaries[dictionary_id]
+
+    def append(self, content, model=None, labels=None, usage=None, status="ok"):
+        """Archive one raw completion and return its record id."""
+        labels = labels or {}
+        section = labels.get("section")
+        version = None
+        if section and labels.get("kind", "section") in ("section", "stream", "structured"):
+            version = templates.version(section)
+        record = {
+            "ts": time.time(), "model": model, "status": status, "labels": labels,
+            "templateVersion": version, "usage": usage, "content": content,
+        }
+        raw = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=self._dictionary)
+        payload = compressor.compress(raw) + compressor.flush()
+        frame = FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                segment_id, name, offset = self._writable_segment(len(frame))
+                # Write at the indexed end of the segment, not the file's end:
+                # bytes left by an append whose transaction never committed
+                # are overwritten instead of shifting every later offset.
+                with open(os.path.join(self.directory, name), "r+b") as f:
+                    f.seek(offset)
+                    f.write(frame)
+                    f.truncate()
+                self._db.execute("UPDATE segments SET size = ? WHERE id = ?",
+                                 (offset + len(frame), segment_id))
+                cursor = self._db.execute(
+                    "INSERT INTO records (ts, company, section, kind, model, template_version, "
+                    "segment, offset, length, raw_length) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (record["ts"], labels.get("company"), section, labels.get("kind", "section"),
+                     model, version, segment_id, offset, len(frame), len(raw)),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return cursor.lastrowid
+
+    def _writable_segment(self, frame_bytes):
+        """``(id, file name, append offset)`` of the segment to write next."""
+        row = self._db.execute(
+            "SELECT id, name, dictionary, size FROM segments ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if (row is not None and row[2] == self._dictionary_id
+                and row[3] + frame_bytes <= self.segment_bytes):
+            return row[0], row[1], row[3]
+        segment_id = (row[0] + 1) if row else 1
+        name = f"segment-{segment_id:06d}.log"
+        header = MAGIC + b" " + self._dictionary_id.encode() + b"\n"
+        with open(os.path.join(self.directory, name), "wb") as f:
+            f.write(header)
+        self._db.execute("INSERT INTO segments VALUES (?, ?, ?, ?)",
+                         (segment_id, name, self._dictionary_id, len(header)))
+        return segment_id, name, len(header)
+
+    def _decode(self, payload, crc, dictionary_id):
+        if zlib.crc32(payload) != crc:
+            raise ArchiveError("frame checksum mismatch")
+        decompressor = zlib.decompressobj(zdict=self._load_dictionary(dictionary_id))
+        return json.loads(decompressor.decompress(payload) + decompressor.flush())
+
+    def get(self, record_id):
+        """Random access: the archived record with ``record_id``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT s.name, s.dictionary, r.offset, r.length FROM records r "
+                "JOIN segments s ON s.id = r.segment WHERE r.id = ?", (record_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(record_id)
+        name, dictionary_id, offset, length = row
+        with open(os.path.join(self.directory, name), "rb") as f:
+            f.seek(offset)
+            frame = f.read(length)
+        size, crc = FRAME.unpack_from(frame)
+        return self._decode(frame[FRAME.size:FRAME.size + size], crc, dictionary_id)
+
+    def scan(self):
+        """Stream every record in append order by reading the segments sequentially."""
+        with self._lock:
+            segments = self._db.execute(
+                "SELECT name, dictionary, size FROM segments ORDER BY id"
+            ).fetchall()
+        for name, dictionary_id, size in segments:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                header = f.readline()
+                if not header.startswith(MAGIC):
+                    raise ArchiveError(f"{name} is not an archive segment")
+                while f.tell() < size:
+                    head = f.read(FRAME.size)
+                    if len(head) < FRAME.size:
+                        break
+                    length, crc = FRAME.unpack(head)
+                    yield self._decode(f.read(length), crc, dictionary_id)
+
+    def select(self, section=None, company=None, since=None):
+        """Random access to the records matching the filters, through the index."""
+        query = "SELECT id FROM records WHERE 1 = 1"
+        params = []
+        for column, value in (("section", section), ("company", company)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        if since is not None:
+            query += " AND ts >= ?"
+            params.append(since)
+        with self._lock:
+            ids = [record_id for (record_id,) in
+                   self._db.execute(query + " ORDER BY id", params).fetchall()]
+        for record_id in ids:
+            yield self.get(record_id)
+
+    def stats(self):
+        with self._lock:
+            records, raw, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_length), 0), COALESCE(SUM(length), 0) "
+                "FROM records"
+            ).fetchone()
+            (segments,) = self._db.execute("SELECT COUNT(*) FROM segments").fetchone()
+        return {"records": records, "segments": segments, "raw_bytes": raw,
+                "stored_bytes": stored, "ratio": raw / stored if stored else None}
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """The process-wide archive at ``ARCHIVE_DIR``."""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = ResponseArchive()
+        return _archive
+
+
+def replay(records, update_cache=False):
+    """Re-parse archived ``records`` with the current extractor; returns counts.
+
+    With ``update_cache``, sections whose template version is still current
+    are written back to the response cache.
+    """
+    from parsing.cache import get_cache
+    from parsing.extract import ExtractionError, extract_json
+    from parsing.schema import validate
+    from parsing.sections import SECTIONS
+
+    counts = Counter()
+    for record in records:
+        labels = record.get("labels") or {}
+        section = labels.get("section")
+        if section not in SECTIONS or labels.get("kind", "section") not in (
+                "section", "stream", "structured"):
+            counts["skipped"] += 1
+            continue
+        try:
+            data = extract_json(record["content"])
+        except ExtractionError:
+            counts["parse_failures"] += 1
+            continue
+        counts["schema_issues" if validate(section, data) else "ok"] += 1
+        if update_cache and record.get("templateVersion") == templates.version(section):
+            get_cache().put(labels["company"], section, record["model"],
+                            record["templateVersion"], data)
+            counts["cached"] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="record count and compression ratio")
+    play = commands.add_parser("replay", help="re-parse archived completions")
+    play.add_argument("--section")
+    play.add_argument("--company")
+    play.add_argument("--since", type=float, help="only the last N hours")
+    play.add_argument("--update-cache", action="store_true",
+                      help="write sections from the current templates back to the cache")
+    dump = commands.add_parser("dump", help="write raw {company, section, content} JSONL")
+    dump.add_argument("output")
+    show = commands.add_parser("show", help="print one record")
+    show.add_argument("id", type=int)
+    args = parser.parse_args()
+
+    archive = get_archive()
+    if args.command == "stats":
+        print(json.dumps(archive.stats(), indent=2))
+    elif args.command == "show":
+        print(json.dumps(archive.get(args.id), indent=2, ensure_ascii=False))
+    elif args.command == "dump":
+        with open(args.output, "w", encoding="utf-8") as out:
+            for record in archive.scan():
+                labels = record.get("labels") or {}
+                out.write(json.dumps({"company": labels.get("company"),
+                                      "section": labels.get("section"),
+                                      "kind": labels.get("kind", "section"),
+                                      "fetchedAt": record["ts"],
+                                      "content": record["content"]}, ensure_ascii=False) + "\n")
+    else:
+        since = time.time() - args.since * 3600 if args.since else None
+        filtered = args.section or args.company or since
+        records = (archive.select(args.section, args.company, since) if filtered
+                   else archive.scan())
+        started = time.perf_counter()
+        counts = replay(records, args.update_cache)
+        elapsed = time.perf_counter() - started
+        print(f"replayed {sum(counts.values()) - counts['cached']} records in {elapsed:.1f}s: "
+              + ", ".join(f"{key} {value}" for key, value in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
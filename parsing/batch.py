@@ -0,0 +1,141 @@
+"""Profile a list of companies in one run.
+
+Every (company, section) pair goes onto one queue drained by a bounded pool
+of workers. Requests are paced by the shared ``parsing.ratelimit`` limiter at
+batch priority, so interactive lookups on the same machine go first, and
+each result is appended to the output JSONL as soon as it finishes:
+
+    python -m parsing.batch companies.csv profiles.jsonl --workers 8 --rate 20
+
+The company list is either a CSV with a ``company`` column (otherwise the
+first column is used) or a JSONL file with a ``company`` or ``name`` field.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from parsing import client
+from parsing.ratelimit import BATCH, get_limiter, set_default_priority
+from parsing.sections import SECTIONS, cached_section, fetch_section
+from parsing.singleflight import get_flights
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+
+
+def read_companies(path):
+    """Return the company names listed in a CSV or JSONL file, in order."""
+    companies = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    companies.append(record.get("company") or record["name"])
+        else:
+            rows = csv.reader(f)
+            header = next(rows, [])
+            names = [cell.strip().lower() for cell in header]
+            # Same columns as JSONL; without either, the first row is data.
+            column = next((names.index(name) for name in ("company", "name") if name in names),
+                          None)
+            if column is None:
+                column = 0
+                if header:
+                    companies.append(header[column])
+            companies.extend(row[column] for row in rows if len(row) > column)
+    return [company.strip() for company in companies if company.strip()]
+
+
+async def run_batch(companies, output, sections=None, workers=DEFAULT_WORKERS,
+                    rate_per_minute=None, use_cache=True, repair=False,
+                    fanout=False, structured=False):
+    """Fetch every section of every company, appending results to ``output``.
+
+    Sections already in the response cache are written straight away and do
+    not take a slot from the rate limiter. ``rate_per_minute`` resets the
+    shared limiter's rate for OpenRouter; otherwise it keeps adapting from
+    where earlier runs left it.
+
+    Returns ``(succeeded, failed)`` counts.
+    """
+    sections = list(sections or SECTIONS)
+    queue = asyncio.Queue()
+    for company in companies:
+        for section in sections:
+            queue.put_nowait((company, section))
+
+    if rate_per_minute:
+        get_limiter().configure(client.OPENROUTER_URL, rate_per_minute)
+    loop = asyncio.get_running_loop()
+    counts = {"ok": 0, "error": 0}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            open(output, "a", encoding="utf-8") as out:
+
+        async def worker():
+            while not queue.empty():
+                company, section = queue.get_nowait()
+                record = {"company": company, "section": section, "fetchedAt": time.time()}
+                try:
+                    data = None
+                    if use_cache:
+                        data = await loop.run_in_executor(executor, cached_section,
+                                                          section, company)
+                    if data is None:
+                        fetch = partial(fetch_section, section, company,
+                                        use_cache=use_cache, repair=repair,
+                                        fanout=fanout, structured=structured)
+                        data = await loop.run_in_executor(executor, fetch)
+                    record["data"] = data
+                    counts["ok"] += 1
+                except Exception as exc:
+                    logger.warning("%s section failed for %s: %r", section, company, exc)
+                    record["error"] = f"{type(exc).__name__}: {exc}"
+                    counts["error"] += 1
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    return counts["ok"], counts["error"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("companies", help="CSV or JSONL file listing the companies")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument("--sections", nargs="+", choices=list(SECTIONS))
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--rate", type=float,
+                        help="reset the shared limiter to this many requests per minute")
+    parser.add_argument("--no-cache", action="store_true", help="always query OpenRouter")
+    parser.add_argument("--repair", action="store_true",
+                        help="re-request missing fields instead of keeping partial sections")
+    parser.add_argument("--fanout", action="store_true",
+                        help="request each top-level block of a section in parallel")
+    parser.add_argument("--structured", action="store_true",
+                        help="send the schema as response_format with a slim prompt")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    set_default_priority(BATCH)
+
+    companies = read_companies(args.companies)
+    succeeded, failed = asyncio.run(
+        run_batch(companies, args.output, args.sections, args.workers, args.rate,
+                  not args.no_cache, args.repair, args.fanout, args.structured)
+    )
+    print(f"{len(companies)} companies: {succeeded} sections fetched, {failed} failed")
+    print(f"client: {client.get_client().metrics()}")
+    print(f"single-flight: {get_flights().metrics()}")
+
+
+if __name__ == "__main__":
+    main()
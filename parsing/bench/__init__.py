@@ -0,0 +1 @@
+"""Benchmarks for the parsing pipeline. Run each module with ``python -m``."""
@@ -0,0 +1,95 @@
+"""Benchmark JSON extraction against the old backtick regex.
+
+Reports, per reply variant, how many replies each extractor recovers and
+the mean time per parse. The corpus is either recorded replies (a directory
+of ``.txt``/``.md`` files, or a JSONL file with a ``content`` field) or a
+synthetic one built from the section prompt examples:
+
+    python -m parsing.bench.extract --synthetic 500
+    python -m parsing.bench.extract --corpus replies/
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from collections import defaultdict
+
+from parsing.extract import ExtractionError, extract_json
+from parsing.sections import SECTIONS, build_prompt
+
+
+def legacy_extract(content):
+    """What every parsing script did before ``parsing.extract``."""
+    json_str = re.search(r'```(.*?)```', content, re.DOTALL).group(1)
+    return json.loads(json_str)
+
+
+def _example(section):
+    prompt = build_prompt(section, "Acme")
+    return json.loads(prompt[prompt.index("{"):prompt.rindex("}") + 1])
+
+
+def _variants(text, rng):
+    yield "fenced", f"```\n{text}\n```"
+    yield "json tag", f"Here is the data:\n```json\n{text}\n```\nLet me know if you need more."
+    yield "no fences", f"Here is the data:\n{text}"
+    yield "trailing commas", "```\n" + re.sub(r'("|\]|\})(\n\s*[}\]])', r"\1,\2", text) + "\n```"
+    yield "smart quotes", "```\n" + re.sub(r'"([^"\n]*)"', r"“\1”", text) + "\n```"
+    yield "truncated", "```json\n" + text[:rng.randint(len(text) // 2, len(text) - 2)]
+
+
+def synthetic_corpus(size, seed=0):
+    rng = random.Random(seed)
+    texts = [json.dumps(_example(section), indent=2, ensure_ascii=False) for section in SECTIONS]
+    corpus = []
+    while len(corpus) < size:
+        corpus.extend(_variants(rng.choice(texts), rng))
+    return corpus[:size]
+
+
+def load_corpus(path):
+    if os.path.isdir(path):
+        names = sorted(n for n in os.listdir(path) if n.endswith((".txt", ".md")))
+        return [("recorded", open(os.path.join(path, n), encoding="utf-8").read()) for n in names]
+    with open(path, encoding="utf-8") as f:
+        return [("recorded", json.loads(line)["content"]) for line in f if line.strip()]
+
+
+def run(corpus, extractor):
+    """Return ``{variant: (recovered, total, seconds)}``."""
+    results = defaultdict(lambda: [0, 0, 0.0])
+    for variant, content in corpus:
+        start = time.perf_counter()
+        try:
+            extractor(content)
+            ok = True
+        except (AttributeError, ValueError, ExtractionError):
+            ok = False
+        elapsed = time.perf_counter() - start
+        row = results[variant]
+        row[0] += ok
+        row[1] += 1
+        row[2] += elapsed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--corpus", help="directory of replies or JSONL with a content field")
+    source.add_argument("--synthetic", type=int, default=600, help="synthetic corpus size")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.synthetic)
+    print(f"{len(corpus)} replies")
+    print(f"{'variant':<16} {'extractor':<8} {'recovered':>10} {'us/parse':>9}")
+    for name, extractor in (("regex", legacy_extract), ("extract", extract_json)):
+        for variant, (ok, total, seconds) in run(corpus, extractor).items():
+            print(f"{variant:<16} {name:<8} {ok:>5}/{total:<4} {seconds / total * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Local stand-in for the OpenRouter chat-completions endpoint.
+
+Replays recorded completions, or synthetic ones built from the section
+schemas, with configurable latency, jitter, error rate, per-token generation
+time and streaming chunk timing, so the pipeline can be measured without
+network access or quota. Prompts that ask for only some top-level blocks
+(repair and fan-out requests) get only those blocks back, and structured
+requests (``response_format``) get bare JSON for the section their schema
+names, or a 400 with ``--no-structured``:
+
+    python -m parsing.bench.mock_server --port 8080 --latency 800 --jitter 400
+    OPENROUTER_URL=http://127.0.0.1:8080/api/v1/chat/completions python -m parsing.engine acme
+
+Recorded completions are a JSONL file of ``{"section", "content"}`` rows.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from parsing.extract import extract_json
+from parsing.schema import section_schema
+from parsing.sections import SECTIONS
+from parsing.templates import estimate_tokens
+
+
+class MockConfig:
+    def __init__(self, latency_ms=800, jitter_ms=400, error_rate=0.0, chunk_chars=40,
+                 chunk_interval_ms=20, corpus=None, seed=None, token_ms=0.0, structured=True):
+        self.latency_ms = latency_ms
+        self.token_ms = token_ms
+        self.structured = structured
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.chunk_chars = chunk_chars
+        self.chunk_interval_ms = chunk_interval_ms
+        self.corpus = corpus or synthetic_corpus()
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def draw(self):
+        """Return ``(delay_seconds, fail)`` for one request."""
+        with self.rng_lock:
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-1, 1) * self.jitter_ms)
+            return delay / 1000, self.rng.random() < self.error_rate
+
+    def pick(self, section):
+        with self.rng_lock:
+            return self.rng.choice(self.corpus.get(section) or self.corpus["core"])
+
+
+def synthetic_corpus():
+    """One fenced example reply per section, filled in from its schema."""
+    corpus = {}
+    for section in SECTIONS:
+        example = json.dumps(section_schema(section), indent=2, ensure_ascii=False)
+        corpus[section] = [f"```json\n{example}\n```"]
+    return corpus
+
+
+def load_corpus(path):
+    corpus = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                corpus.setdefault(record["section"], []).append(record["content"])
+    return corpus
+
+
+def _schema_keys(shape):
+    if isinstance(shape, dict):
+        return set(shape).union(*(_schema_keys(sub) for sub in shape.values()))
+    if isinstance(shape, list) and shape:
+        return _schema_keys(shape[0])
+    return set()
+
+
+@lru_cache(maxsize=None)
+def _section_keys(section):
+    return frozenset(_schema_keys(section_schema(section)))
+
+
+def detect_section(prompt):
+    """Return the best-matching section and the top-level keys the prompt asks for."""
+    quoted = set(re.findall(r'"(\w+)"', prompt))
+    section = max(SECTIONS, key=lambda section: len(quoted & _section_keys(section)))
+    return section, quoted & set(section_schema(section))
+
+
+def select_blocks(content, keys):
+    """Trim a recorded reply down to the top-level ``keys`` a prompt asked for."""
+    try:
+        data = extract_json(content)
+    except ValueError:
+        return content
+    if not isinstance(data, dict) or not keys or keys >= set(data):
+        return content
+    blocks = {key: value for key, value in data.items() if key in keys}
+    return f"```json\n{json.dumps(blocks, indent=2, ensure_ascii=False)}\n```"
+
+
+def make_handler(config):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, headers=()):
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            prompt = payload["messages"][-1]["content"]
+            delay, fail = config.draw()
+            time.sleep(delay)
+            if fail:
+                body = json.dumps({"error": {"message": "Rate limit exceeded", "code": 429}})
+                self._send(429, body.encode(), [("Content-Type", "application/json"),
+                                                ("Retry-After", "1")])
+                return
+
+            response_format = payload.get("response_format")
+            if response_format is not None:
+                if not config.structured:
+                    body = json.dumps({"error": {"message": "Provider does not support "
+                                                 "response_format", "code": 400}})
+                    self._send(400, body.encode(), [("Content-Type", "application/json")])
+                    return
+                schema = response_format["json_schema"]
+                section = schema["name"].rsplit("_", 1)[0]
+                # The same reply as template mode, so only prompt tokens differ.
+                content = config.pick(section)
+                prompt += json.dumps(schema, separators=(",", ":"))
+            else:
+                section, keys = detect_section(prompt)
+                content = select_blocks(config.pick(section), keys)
+            usage = {
+                "prompt_tokens": estimate_tokens(prompt),
+                "completion_tokens": estimate_tokens(content),
+                "cost": 0,
+            }
+            if payload.get("stream"):
+                try:
+                    self._stream(content, usage)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Streaming clients hang up once the JSON object closes.
+                    self.close_connection = True
+                return
+            time.sleep(usage["completion_tokens"] * config.token_ms / 1000)
+            body = json.dumps({
+                "model": payload.get("model"),
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+                "usage": usage,
+            })
+            self._send(200, body.encode(), [("Content-Type", "application/json")])
+
+        def _stream(self, content, usage):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self._chunk(": OPENROUTER PROCESSING\n\n")
+            for i in range(0, len(content), config.chunk_chars):
+                delta = content[i:i + config.chunk_chars]
+                event = {"choices": [{"delta": {"content": delta}}]}
+                self._chunk(f"data: {json.dumps(event)}\n\n")
+                time.sleep((config.chunk_interval_ms
+                            + estimate_tokens(delta) * config.token_ms) / 1000)
+            self._chunk(f"data: {json.dumps({'choices': [{'delta': {}}], 'usage': usage})}\n\n")
+            self._chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _chunk(self, text):
+            data = text.encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+    return Handler
+
+
+class MockServer(ThreadingHTTPServer):
+    # A full-profile burst opens dozens of connections at once; with the
+    # default backlog of 5 the kernel drops SYNs and the 1s retransmit shows
+    # up as tail latency that the pipeline never caused.
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def serve(config, host="127.0.0.1", port=8080):
+    return MockServer((host, port), make_handler(config))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=800, help="mean latency in ms")
+    parser.add_argument("--jitter", type=float, default=400, help="+/- ms around the mean")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 429 replies")
+    parser.add_argument("--token-ms", type=float, default=0.0,
+                        help="generation time per completion token in ms")
+    parser.add_argument("--chunk-chars", type=int, default=40)
+    parser.add_argument("--chunk-interval", type=float, default=20, help="ms between chunks")
+    parser.add_argument("--corpus", help="JSONL of recorded {section, content} replies")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--no-structured", action="store_true",
+                        help="reject response_format like a model without structured output")
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.chunk_chars,
+                        args.chunk_interval, load_corpus(args.corpus) if args.corpus else None,
+                        args.seed, args.token_ms, not args.no_structured)
+    server = serve(config, args.host, args.port)
+    print(f"mock OpenRouter on http://{args.host}:{server.server_port}/api/v1/chat/completions",
+          flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
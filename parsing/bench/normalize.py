@@ -0,0 +1,100 @@
+"""Benchmark numeric normalisation of a large batch of sections.
+
+Compares parsing every numeric leaf row by row (a fresh ``Normalizer`` per
+section, as a naive per-record loop would) with one shared ``Normalizer``
+over the whole batch, which parses each distinct string once. The corpus is
+either a batch output JSONL or synthetic sections whose numeric leaves are
+filled with the kinds of text models return:
+
+    python -m parsing.bench.normalize --synthetic 20000
+    python -m parsing.bench.normalize --corpus results.jsonl
+"""
+
+import argparse
+import json
+import random
+import time
+
+from parsing.normalize import (BOOLEAN, COUNT, CURRENCY, PERCENT, SCORE, STRING, YEAR,
+                               Normalizer, section_kinds)
+from parsing.schema import section_schema
+from parsing.sections import SECTIONS
+
+
+def _value(kind, rng):
+    if kind == PERCENT:
+        return rng.choice(["{}%", "~{}%", "{} percent", "{}-{}%"]).format(
+            rng.randint(1, 60), rng.randint(61, 99))
+    if kind == SCORE:
+        return rng.choice(["{}.{}/5", "{}.{}", "{}.{} out of 5"]).format(
+            rng.randint(2, 4), rng.randint(0, 9))
+    if kind == COUNT:
+        return rng.choice(["{},000+", "{}", "~{}k", "{}-{}", "over {},000"]).format(
+            rng.randint(1, 99), rng.randint(100, 200))
+    if kind == CURRENCY:
+        return rng.choice(["${}B", "₹{} Cr", "USD {}.{} million", "${}-{}M", "Rs. {} lakh"]).format(
+            rng.randint(1, 50), rng.randint(51, 99))
+    if kind == YEAR:
+        return str(rng.randint(1990, 2025))
+    if kind == BOOLEAN:
+        return rng.choice(["true", "false", "Yes, laptops provided"])
+    return None
+
+
+def _fill(shape, kinds, rng):
+    if isinstance(kinds, dict):
+        return {key: _fill(shape.get(key), sub, rng) for key, sub in kinds.items()}
+    if isinstance(kinds, list):
+        item = shape[0] if isinstance(shape, list) and shape else None
+        return [_fill(item, kinds[0], rng) for _ in range(rng.randint(1, 4))]
+    return shape if kinds == STRING else _value(kinds, rng)
+
+
+def synthetic_corpus(size, seed=0):
+    """``[(section, data)]`` with randomised numeric text in every numeric leaf."""
+    rng = random.Random(seed)
+    sections = list(SECTIONS)
+    corpus = []
+    for i in range(size):
+        section = sections[i % len(sections)]
+        corpus.append((section, _fill(section_schema(section), section_kinds(section), rng)))
+    return corpus
+
+
+def load_corpus(path):
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [(r["section"], r["data"]) for r in records if "data" in r and r["section"] in SECTIONS]
+
+
+def run(corpus, shared):
+    normalizer = Normalizer()
+    start = time.perf_counter()
+    for section, data in corpus:
+        if not shared:
+            normalizer = Normalizer()
+        normalizer.normalize(section, data)
+    return time.perf_counter() - start, normalizer.distinct
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--synthetic", type=int, default=20000, help="synthetic sections")
+    parser.add_argument("--corpus", help="batch output JSONL to normalise instead")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = synthetic_corpus(args.synthetic, args.seed)
+    print(f"{len(corpus)} sections")
+    for name, shared in (("per row", False), ("batch", True)):
+        seconds, distinct = run(corpus, shared)
+        rate = len(corpus) / seconds if seconds else float("inf")
+        note = f"  {distinct} distinct strings parsed" if shared else ""
+        print(f"{name:<8} {seconds:8.2f}s  {rate:10.0f} sections/s{note}")
+
+
+if __name__ == "__main__":
+    main()
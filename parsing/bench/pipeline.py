@@ -0,0 +1,113 @@
+"""End-to-end latency and throughput benchmark against the mock server.
+
+Starts ``parsing.bench.mock_server`` in a subprocess, then for each
+concurrency level fetches full profiles (all seven sections, cache off) for
+that many companies at once and reports requests/sec, p50/p99 request
+latency and peak RSS. Each level runs in a fresh process so its RSS peak is
+its own:
+
+    python -m parsing.bench.pipeline --levels 1 10 100 --latency 800 --jitter 400
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from parsing import client
+from parsing.metrics import MetricsSink, percentile
+
+
+def run_level(url, companies, fanout=False):
+    """Fetch ``companies`` full profiles concurrently; runs in a worker process."""
+    from parsing.engine import fetch_profile
+
+    sink = MetricsSink(":memory:")
+    client.set_client(client.OpenRouterClient(url=url, pool_size=max(32, companies * 7),
+                                              sink=sink))
+
+    async def run():
+        return await asyncio.gather(*(
+            fetch_profile(f"Company {i}", use_cache=False, fanout=fanout)
+            for i in range(companies)
+        ))
+
+    start = time.perf_counter()
+    profiles = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    rows = sink.rows()
+    latencies = [row["total_ms"] for row in rows if row["status"] == "ok"]
+    return {
+        "companies": companies,
+        "requests": len(rows),
+        "failed_sections": sum(len(p.get("errors", {})) for p in profiles),
+        "seconds": elapsed,
+        "rps": len(rows) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_mock_server(args):
+    port = _free_port()
+    command = [sys.executable, "-m", "parsing.bench.mock_server", "--port", str(port),
+               "--latency", str(args.latency), "--jitter", str(args.jitter),
+               "--error-rate", str(args.error_rate), "--token-ms", str(args.token_ms),
+               "--seed", "0"]
+    if args.corpus:
+        command += ["--corpus", args.corpus]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    server.stdout.readline()
+    return server, f"http://127.0.0.1:{port}/api/v1/chat/completions"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 10, 100],
+                        help="concurrent companies per run")
+    parser.add_argument("--latency", type=float, default=800)
+    parser.add_argument("--jitter", type=float, default=400)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-ms", type=float, default=0.0,
+                        help="mock generation time per completion token in ms")
+    parser.add_argument("--fanout", action="store_true",
+                        help="fetch sections as parallel per-block requests")
+    parser.add_argument("--corpus", help="JSONL of recorded {section, content} replies")
+    parser.add_argument("--url", help="benchmark an already running server instead")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server, url = start_mock_server(args)
+    try:
+        print(f"{'companies':>9} {'requests':>8} {'failed':>6} {'seconds':>8} {'req/s':>7} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'peak RSS MB':>11}")
+        context = multiprocessing.get_context("spawn")
+        for companies in args.levels:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                r = pool.submit(run_level, url, companies, args.fanout).result()
+            print(f"{r['companies']:>9} {r['requests']:>8} {r['failed_sections']:>6} "
+                  f"{r['seconds']:>8.2f} {r['rps']:>7.1f} {r['p50_ms']:>8.0f} "
+                  f"{r['p99_ms']:>8.0f} {r['peak_rss_mb']:>11.1f}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
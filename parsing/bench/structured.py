@@ -0,0 +1,103 @@
+"""Compare template prompts with structured-output requests.
+
+Fetches every section for a set of companies twice, once with the registry
+template and once with ``--structured`` (schema in ``response_format``), and
+reports requests, prompt and completion tokens, parse failures, sections
+with schema issues and median latency for each mode. Runs against an
+in-process ``parsing.bench.mock_server`` unless ``--url`` points at a real
+endpoint. The mock returns the same reply in both modes, so against it only
+prompt tokens are compared; completion tokens need a real endpoint:
+
+    python -m parsing.bench.structured --companies 20
+    python -m parsing.bench.structured --corpus replies.jsonl
+    python -m parsing.bench.structured --companies 2 \\
+        --url https://openrouter.ai/api/v1/chat/completions
+"""
+
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from parsing import client
+from parsing.bench.mock_server import MockConfig, load_corpus, serve
+from parsing.extract import ExtractionError
+from parsing.metrics import MetricsSink, percentile
+from parsing.schema import validate
+from parsing.sections import SECTIONS, fetch_section
+
+
+def run_mode(url, companies, structured, workers=16, model=client.MODEL):
+    """Fetch every section of ``companies`` and return the mode's totals."""
+    sink = MetricsSink(":memory:")
+    client.set_client(client.OpenRouterClient(url=url, sink=sink))
+    counts = {"parse_failures": 0, "errors": 0, "schema_issues": 0}
+    lock = threading.Lock()
+
+    def fetch(job):
+        company, section = job
+        try:
+            data = fetch_section(section, company, model, use_cache=False,
+                                 structured=structured)
+        except ExtractionError:
+            outcome = "parse_failures"
+        except Exception:
+            outcome = "errors"
+        else:
+            outcome = "schema_issues" if validate(section, data) else None
+        if outcome:
+            with lock:
+                counts[outcome] += 1
+
+    jobs = [(company, section) for company in companies for section in SECTIONS]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, jobs))
+
+    rows = sink.rows()
+    return {
+        "sections": len(jobs),
+        "requests": len(rows),
+        "prompt_tokens": sum(row["prompt_tokens"] or 0 for row in rows),
+        "completion_tokens": sum(row["completion_tokens"] or 0 for row in rows),
+        "p50_ms": percentile([row["total_ms"] for row in rows if row["status"] == "ok"], 50),
+        **counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--model", default=client.MODEL)
+    parser.add_argument("--latency", type=float, default=50, help="mock latency in ms")
+    parser.add_argument("--corpus", help="JSONL of recorded {section, content} replies")
+    parser.add_argument("--no-structured", action="store_true",
+                        help="make the mock reject response_format to exercise the fallback")
+    parser.add_argument("--url", help="benchmark this endpoint instead of the mock")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        corpus = load_corpus(args.corpus) if args.corpus else None
+        config = MockConfig(args.latency, 0, corpus=corpus, seed=0,
+                            structured=not args.no_structured)
+        server = serve(config, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/api/v1/chat/completions"
+
+    companies = [f"Company {i}" for i in range(args.companies)]
+    try:
+        print(f"{'mode':<11} {'sections':>8} {'requests':>8} {'prompt tok':>10} "
+              f"{'compl. tok':>10} {'parse fail':>10} {'errors':>6} {'schema':>6} {'p50 ms':>7}")
+        for name, structured in (("template", False), ("structured", True)):
+            r = run_mode(url, companies, structured, args.workers, args.model)
+            print(f"{name:<11} {r['sections']:>8} {r['requests']:>8} {r['prompt_tokens']:>10} "
+                  f"{r['completion_tokens']:>10} {r['parse_failures']:>10} {r['errors']:>6} "
+                  f"{r['schema_issues']:>6} {r['p50_ms'] or 0:>7.0f}")
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""On-disk cache of parsed section responses.
+
+Entries are keyed on company, section, model and the prompt template
+version from ``parsing.templates``, so editing a template or switching
+models never serves a stale shape. Each section has its own TTL (news goes
+stale in hours, legal details in months) and the table is trimmed
+least-recently-used first once it holds more than ``max_entries`` rows.
+
+    python -m parsing.cache stats
+    python -m parsing.cache clear --section news
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+SECTION_TTLS = {
+    "news": 6 * HOUR,
+    "jobs": 7 * DAY,
+    "interview": 30 * DAY,
+    "tech": 30 * DAY,
+    "culture": 30 * DAY,
+    "ways": 30 * DAY,
+    "core": 90 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+DEFAULT_MAX_ENTRIES = 10_000
+CACHE_DIR = os.environ.get("INSIDER_CACHE_DIR", os.path.expanduser("~/.cache/insider"))
+DEFAULT_PATH = os.path.join(CACHE_DIR, "responses.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    section TEXT NOT NULL,
+    model TEXT NOT NULL,
+    template_version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def cache_key(company, section, model, template_version):
+    return "|".join((company.strip().lower(), section, model, template_version))
+
+
+class ResponseCache:
+    """SQLite-backed TTL + LRU cache, safe to share between worker threads."""
+
+    def __init__(self, path=DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES, ttls=None):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.ttls = dict(SECTION_TTLS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def ttl(self, section):
+        return self.ttls.get(section, DEFAULT_TTL)
+
+    def get(self, company, section, model, template_version):
+        """Return the cached value, or ``None`` if missing or expired."""
+        key = cache_key(company, section, model, template_version)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if now - created_at > self.ttl(section):
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def put(self, company, section, model, template_version, value):
+        key = cache_key(company, section, model, template_version)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, company.strip().lower(), section, model, template_version,
+                 json.dumps(value), now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def clear(self, section=None):
+        with self._lock:
+            if section is None:
+                self._db.execute("DELETE FROM responses")
+            else:
+                self._db.execute("DELETE FROM responses WHERE section = ?", (section,))
+
+    def companies(self):
+        """Every company with at least one cached section."""
+        with self._lock:
+            rows = self._db.execute("SELECT DISTINCT company FROM responses").fetchall()
+        return [company for (company,) in rows]
+
+    def stats(self):
+        """Return ``{section: (entries, expired)}``."""
+        now = time.time()
+        stats = {}
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT section, created_at FROM responses"
+            ).fetchall()
+        for section, created_at in rows:
+            entries, expired = stats.get(section, (0, 0))
+            stats[section] = (entries + 1, expired + (now - created_at > self.ttl(section)))
+        return stats
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Process-wide cache at ``DEFAULT_PATH``, opened on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--section")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.path)
+    if args.command == "clear":
+        cache.clear(args.section)
+        return
+    for section, (entries, expired) in sorted(cache.stats().items()):
+        print(f"{section:<10} {entries:>7} entries  {expired:>7} expired  "
+              f"ttl {cache.ttl(section)}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Map company name variants onto one canonical name before fetching.
+
+"Meta", "meta", "Meta Platforms, Inc." and "Facebook" would otherwise each
+get their own prompt and cache entry. Names are first normalised (case,
+punctuation and legal suffixes such as "Inc." or "Pvt Ltd"), then looked up
+in the alias table at ``ALIASES_PATH`` and among the names already in the
+response cache. Only the curated alias table is matched fuzzily: a
+character trigram index picks the candidates, and a candidate is accepted
+when it is one swapped pair of letters away ("Microsfot") or ``difflib``
+scores it above ``FUZZY_THRESHOLD``. Names seen at runtime are never fuzzy
+targets, so "Revolut" cannot be rewritten to an earlier "Revolt", and a
+one-letter difference ("Salesforge") stays a different company. Anything
+else becomes a new canonical name as given:
+
+    python -m parsing.canonical "Meta Platforms Inc." facebook Microsfot
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict, namedtuple
+from difflib import SequenceMatcher
+
+ALIASES_PATH = os.environ.get(
+    "INSIDER_ALIASES", os.path.join(os.path.dirname(__file__), "aliases.json")
+)
+FUZZY_THRESHOLD = 0.92
+MIN_FUZZY_LENGTH = 5
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "llc", "llp", "plc", "pvt", "private", "gmbh", "ag", "sa", "nv", "bv", "and",
+}
+
+Match = namedtuple("Match", "name how score")
+EXACT = "exact"
+ALIAS = "alias"
+FUZZY = "fuzzy"
+NEW = "new"
+
+
+def name_key(name):
+    """Lower-case ASCII words of ``name`` without punctuation or legal suffixes."""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    words = re.sub(r"[^a-z0-9]+", " ", text.lower().replace("&", " and ")).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def transposed(a, b):
+    """True if ``b`` is ``a`` with one pair of adjacent characters swapped."""
+    if len(a) != len(b):
+        return False
+    diffs = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    return (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+            and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+
+
+def load_aliases(path=ALIASES_PATH):
+    """``{canonical: [aliases]}`` from the alias table, or ``{}`` if it is missing."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class CompanyResolver:
+    """Resolves names to canonical names; safe to share between threads."""
+
+    def __init__(self, aliases=None, threshold=FUZZY_THRESHOLD):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._canonical = {}
+        self._aliases = {}
+        self._index = defaultdict(set)
+        for canonical, names in (load_aliases() if aliases is None else aliases).items():
+            self.add(canonical, names)
+
+    def add(self, canonical, aliases=(), curated=True):
+        """Register ``canonical`` and the ``aliases`` that should resolve to it.
+
+        Only ``curated`` names (the alias table) become fuzzy-match targets;
+        others are matched exactly.
+        """
+        with self._lock:
+            self._add(canonical, aliases, curated)
+
+    def _add(self, canonical, aliases=(), curated=False):
+        key = name_key(canonical)
+        if not key:
+            return
+        self._canonical.setdefault(key, canonical)
+        if curated:
+            self._index_key(key)
+        for alias in aliases:
+            alias_key = name_key(alias)
+            if alias_key and alias_key != key:
+                self._aliases[alias_key] = key
+                if curated:
+                    self._index_key(alias_key)
+
+    def _index_key(self, key):
+        for gram in trigrams(key):
+            self._index[gram].add(key)
+
+    def resolve(self, name):
+        """Return a ``Match`` of the canonical name for ``name`` and how it was found."""
+        key = name_key(name)
+        with self._lock:
+            if key in self._canonical:
+                return Match(self._canonical[key], EXACT, 1.0)
+            if key in self._aliases:
+                return Match(self._canonical[self._aliases[key]], ALIAS, 1.0)
+            match = self._fuzzy(key)
+            if match is not None:
+                return match
+            self._add(name.strip())
+            return Match(name.strip(), NEW, 0.0)
+
+    def canonical(self, name):
+        return self.resolve(name).name
+
+    def _fuzzy(self, key):
+        if len(key) < MIN_FUZZY_LENGTH:
+            return None
+        candidates = {known for gram in trigrams(key) for known in self._index.get(gram, ())}
+        digits = re.sub(r"\D", "", key)
+        best, score = None, 0.0
+        matcher = SequenceMatcher(b=key, autojunk=False)
+        for known in candidates:
+            # "Web3 Labs" and "Web2 Labs" are different companies.
+            if len(known) < MIN_FUZZY_LENGTH or re.sub(r"\D", "", known) != digits:
+                continue
+            matcher.set_seq1(known)
+            typo = transposed(key, known)
+            if not typo and (matcher.real_quick_ratio() < self.threshold
+                             or matcher.quick_ratio() < self.threshold):
+                continue
+            candidate_score = matcher.ratio()
+            if typo or candidate_score >= self.threshold:
+                if candidate_score > score:
+                    best, score = known, candidate_score
+        if best is None:
+            return None
+        return Match(self._canonical[self._aliases.get(best, best)], FUZZY, score)
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver():
+    """Process-wide resolver seeded with the alias table and the cached companies.
+
+    Cached names only resolve exactly; they are not fuzzy targets.
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            from parsing.cache import get_cache
+
+            _resolver = CompanyResolver()
+            for company in get_cache().companies():
+                _resolver.add(company, curated=False)
+        return _resolver
+
+
+def canonical_name(name):
+    """The canonical spelling of company ``name`` used for prompts and cache keys."""
+    return get_resolver().canonical(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="+")
+    args = parser.parse_args()
+    resolver = get_resolver()
+    for name in args.names:
+        match = resolver.resolve(name)
+        print(f"{name!r:<30} -> {match.name!r:<30} {match.how} {match.score:.2f}")
+
+
+if __name__ == "__main__":
+    main()
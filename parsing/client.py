@@ -0,0 +1,353 @@
+"""OpenRouter chat-completion calls shared by every section parser.
+
+All requests go through one pooled ``requests.Session`` so connections (and
+their TLS handshakes) are reused across sections and worker threads. Every
+call has connect/read timeouts, and 429/5xx responses are retried with
+jittered exponential backoff that honours ``Retry-After``. Every attempt
+first waits on the shared ``parsing.ratelimit`` limiter, which adapts to the
+rate-limit headers of each response. Each completion is recorded in the
+``parsing.metrics`` sink with its tokens and latency, timed from when the
+limiter let it through so local queueing is not counted, and its raw text is
+appended to the ``parsing.archive`` log so it can be re-parsed later.
+Requests to OpenRouter need ``OPENROUTER_API_KEY`` in the environment.
+"""
+
+import email.utils
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from parsing.archive import ARCHIVE_ENABLED, get_archive
+from parsing.metrics import get_sink
+from parsing.ratelimit import RATE_PER_MINUTE, get_limiter
+
+logger = logging.getLogger(__name__)
+
+OPENROUTER_HOST = "openrouter.ai"
+OPENROUTER_URL = os.environ.get(
+    "OPENROUTER_URL", f"https://{OPENROUTER_HOST}/api/v1/chat/completions"
+)
+MODEL = "meta-llama/llama-3.3-8b-instruct:free"
+API_KEY = os.environ.get("OPENROUTER_API_KEY")
+
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 180
+POOL_SIZE = 32
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class OpenRouterError(Exception):
+    """Non-retryable failure, or a retryable one that ran out of attempts."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def retry_after(response):
+    """Seconds the server asked us to wait, or ``None``."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, response=None):
+    """Full-jitter exponential backoff, stretched to cover ``Retry-After``."""
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    hint = retry_after(response) if response is not None else None
+    if hint is not None:
+        delay = max(delay, hint + random.uniform(0, BACKOFF_BASE))
+    return delay
+
+
+class OpenRouterClient:
+    """Pooled, retrying client for the chat-completions endpoint."""
+
+    def __init__(self, url=OPENROUTER_URL, api_key=API_KEY, pool_size=POOL_SIZE,
+                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), max_retries=MAX_RETRIES, sink=None,
+                 limiter=None, archive=None):
+        if not api_key and urlsplit(url).hostname == OPENROUTER_HOST:
+            raise OpenRouterError(
+                "OPENROUTER_API_KEY is not set; export your OpenRouter API key to make requests"
+            )
+        self.url = url
+        self.sink = sink
+        self.limiter = limiter
+        self.archive = archive
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
+        if api_key:
+            # Mock servers and local proxies are used without a key.
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._in_flight = 0
+
+    def _track(self, delta):
+        with self._lock:
+            self._in_flight += delta
+            self._counts["peak_in_flight"] = max(self._counts["peak_in_flight"], self._in_flight)
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counts[name] += n
+
+    def post(self, payload, stream=False, on_send=None):
+        """POST ``payload`` and return the successful ``requests.Response``.
+
+        The response carries ``attempts`` and ``first_byte_at`` (a
+        ``time.perf_counter`` timestamp of when its headers arrived).
+        ``on_send`` is called once the rate limiter lets the first attempt
+        through, just before it is sent.
+        """
+        body = json.dumps(payload)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire(self.url)
+            if on_send is not None and attempt == 0:
+                on_send()
+            self._count("requests")
+            self._track(1)
+            response = None
+            started = time.perf_counter()
+            try:
+                response = self.session.post(self.url, data=body, timeout=self.timeout,
+                                             stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = exc
+            else:
+                if self.limiter is not None:
+                    self.limiter.observe(self.url, response.status_code, response.headers,
+                                         retry_after(response))
+                if response.ok:
+                    response.attempts = attempt + 1
+                    response.first_byte_at = started + response.elapsed.total_seconds()
+                    return response
+                error = OpenRouterError(
+                    f"HTTP {response.status_code}: {response.text[:500]}", response.status_code
+                )
+                if response.status_code not in RETRY_STATUSES:
+                    self._count("failures")
+                    raise error
+                response.close()
+            finally:
+                self._track(-1)
+
+            if attempt >= self.max_retries:
+                self._count("failures")
+                raise error
+            delay = backoff_delay(attempt, response)
+            logger.info("retrying OpenRouter call in %.1fs after %r", delay, error)
+            self._count("retries")
+            time.sleep(delay)
+            attempt += 1
+
+    def _record(self, model, labels, started, status, response=None, first_byte_at=None,
+                usage=None):
+        if self.sink is None:
+            return
+        now = time.perf_counter()
+        self.sink.record(
+            model, status, (now - started) * 1000, labels,
+            attempts=getattr(response, "attempts", None),
+            ttfb_ms=None if first_byte_at is None else (first_byte_at - started) * 1000,
+            usage=usage,
+        )
+
+    def _archive(self, content, model, labels, usage):
+        if self.archive is None:
+            return
+        try:
+            self.archive.append(content, model, labels, usage)
+        except (OSError, sqlite3.Error) as exc:
+            # Losing an archive record must not fail a completion we paid for.
+            logger.warning("could not archive %s completion: %s", model, exc)
+
+    def chat(self, prompt, model=MODEL, labels=None, response_format=None):
+        """Send ``prompt`` as a single user message and return the reply text.
+
+        ``labels`` (``company``, ``section``, ``kind``) tag the metrics row;
+        ``response_format`` is passed through for structured output.
+        """
+        started = time.perf_counter()
+        response = None
+
+        def sent():
+            nonlocal started
+            started = time.perf_counter()
+
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "usage": {"include": True},
+        }
+        if response_format is not None:
+            payload["response_format"] = response_format
+        try:
+            response = self.post(payload, on_send=sent)
+            response_json = response.json()
+            if "error" in response_json:
+                error = response_json["error"]
+                raise OpenRouterError(f"OpenRouter error: {error.get('message', error)}",
+                                      error.get("code"))
+            content = response_json["choices"][0]["message"]["content"]
+        except Exception:
+            self._record(model, labels, started, "error", response)
+            raise
+        self._record(model, labels, started, "ok", response,
+                     response.first_byte_at, response_json.get("usage"))
+        self._archive(content, model, labels, response_json.get("usage"))
+        return content
+
+    def stream_chat(self, prompt, model=MODEL, labels=None, complete=None, on_send=None):
+        """Like ``chat`` but with ``stream: true``, yielding text deltas as they arrive.
+
+        Time to first byte is recorded as the arrival of the first token.
+        ``complete`` tells whether the caller already has the whole answer;
+        if it returns true when the stream is closed early, the rest of the
+        stream is read for its usage and the call is recorded as ``ok``
+        rather than ``closed``. ``on_send`` is passed on to ``post``.
+        """
+        started = time.perf_counter()
+        response = None
+        first_token_at = None
+        usage = None
+        status = "error"
+        parts = []
+
+        def sent():
+            nonlocal started
+            started = time.perf_counter()
+            if on_send is not None:
+                on_send()
+
+        try:
+            response = self.post({
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "stream": True,
+                "usage": {"include": True},
+            }, stream=True, on_send=sent)
+            with response:
+                chunks = stream_chunks(response)
+                try:
+                    for chunk in chunks:
+                        usage = chunk.get("usage") or usage
+                        content = chunk_content(chunk)
+                        if content:
+                            if first_token_at is None:
+                                first_token_at = time.perf_counter()
+                            parts.append(content)
+                            yield content
+                except GeneratorExit:
+                    status = "closed"
+                    if complete is not None and complete():
+                        try:
+                            for chunk in chunks:
+                                usage = chunk.get("usage") or usage
+                                parts.append(chunk_content(chunk) or "")
+                        except Exception as exc:
+                            logger.info("could not read the rest of a closed stream: %r", exc)
+                        else:
+                            status = "ok"
+                            self._archive("".join(parts), model, labels, usage)
+                    raise
+            status = "ok"
+            self._archive("".join(parts), model, labels, usage)
+        finally:
+            self._record(model, labels, started, status, response, first_token_at, usage)
+
+    def metrics(self):
+        """Request, retry and connection-pool counters since the client was created."""
+        with self._lock:
+            metrics = dict(self._counts, in_flight=self._in_flight)
+        pools = self._adapter.poolmanager.pools
+        connections = 0
+        pooled_requests = 0
+        for key in pools.keys():
+            pool = pools[key]
+            connections += pool.num_connections
+            pooled_requests += pool.num_requests
+        metrics.update(connections_opened=connections, pooled_requests=pooled_requests)
+        return metrics
+
+
+def stream_chunks(response):
+    """Yield the JSON chunks of a streamed completion up to ``[DONE]``."""
+    for line in response.iter_lines(decode_unicode=True):
+        # Blank lines separate events; ':' lines are keep-alive comments.
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return
+        chunk = json.loads(data)
+        if "error" in chunk:
+            error = chunk["error"]
+            raise OpenRouterError(f"OpenRouter error: {error.get('message', error)}",
+                                  error.get("code"))
+        yield chunk
+
+
+def chunk_content(chunk):
+    choices = chunk.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content")
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client shared by every section parser."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            limiter = get_limiter() if RATE_PER_MINUTE > 0 else None
+            archive = get_archive() if ARCHIVE_ENABLED else None
+            _default_client = OpenRouterClient(sink=get_sink(), limiter=limiter,
+                                               archive=archive)
+        return _default_client
+
+
+def set_client(client):
+    """Replace the shared client, e.g. to point a benchmark at a mock server."""
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+
+def chat(prompt, model=MODEL, labels=None, response_format=None):
+    """Send ``prompt`` through the shared client and return the reply text."""
+    return get_client().chat(prompt, model, labels, response_format)
+
+
+def stream_chat(prompt, model=MODEL, labels=None, complete=None, on_send=None):
+    """Stream the reply to ``prompt`` through the shared client, delta by delta."""
+    return get_client().stream_chat(prompt, model, labels, complete, on_send)
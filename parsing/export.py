@@ -0,0 +1,177 @@
+"""Export parsed sections as typed Parquet or Arrow tables for analytics.
+
+Each section becomes one table with a row per company fetch. Nested objects
+are flattened into dotted columns (``internshipConversion.rate``), arrays of
+objects become ``list<struct>`` columns (``hiringProcess``), and leaves are
+typed by ``parsing.normalize``: percentages, scores, counts and years become
+numbers, amounts become ``{value, currency}`` and ``true/false`` booleans.
+Files are written partitioned by section and fetch date,
+``<out>/section=jobs/fetch_date=2025-06-01/part-....parquet``, so they can
+be scanned with ``pyarrow.dataset`` or pandas without parsing JSON.
+
+Rows come from the latest version of every profile in ``parsing.store``
+or from the JSONL written by ``parsing.batch``:
+
+    python -m parsing.export write exports/
+    python -m parsing.export write exports/ --jsonl results.jsonl --format arrow
+    python -m parsing.export columns jobs
+
+Requires ``pyarrow`` (``pip install pyarrow``) for writing.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from parsing.normalize import (BOOLEAN, COUNT, CURRENCY, PERCENT, SCORE, YEAR, Normalizer,
+                               shape_kinds)
+from parsing.schema import section_schema
+from parsing.sections import SECTIONS
+
+
+def _columns(shape, path=""):
+    for key, sub in shape.items():
+        column = f"{path}.{key}" if path else key
+        if isinstance(sub, dict):
+            yield from _columns(sub, column)
+        else:
+            yield column, tuple(column.split(".")), shape_kinds(sub)
+
+
+@lru_cache(maxsize=None)
+def section_columns(section):
+    """``[(column, key path, kinds)]`` for the flattened columns of ``section``."""
+    return list(_columns(section_schema(section)))
+
+
+def flatten(section, data, normalizer=None):
+    """One row dict of typed column values for a parsed ``section``."""
+    normalizer = normalizer or Normalizer()
+    row = {}
+    for column, keys, kinds in section_columns(section):
+        node = data
+        for key in keys:
+            node = node.get(key) if isinstance(node, dict) else None
+        row[column] = normalizer.convert(kinds, node)
+    return row
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("exporting needs pyarrow: pip install pyarrow") from exc
+    return pyarrow
+
+
+def arrow_type(pa, kinds):
+    if isinstance(kinds, dict):
+        return pa.struct([(key, arrow_type(pa, sub)) for key, sub in kinds.items()])
+    if isinstance(kinds, list):
+        return pa.list_(arrow_type(pa, kinds[0]))
+    if kinds == CURRENCY:
+        return pa.struct([("value", pa.float64()), ("currency", pa.string())])
+    return {
+        BOOLEAN: pa.bool_(),
+        PERCENT: pa.float64(),
+        SCORE: pa.float64(),
+        COUNT: pa.int64(),
+        YEAR: pa.int32(),
+    }.get(kinds, pa.string())
+
+
+def arrow_schema(section):
+    pa = _pyarrow()
+    fields = [("company", pa.string()), ("fetched_at", pa.timestamp("s", tz="UTC"))]
+    fields += [(column, arrow_type(pa, kinds))
+               for column, _keys, kinds in section_columns(section)]
+    return pa.schema(fields)
+
+
+def store_records():
+    """``(company, section, fetchedAt, data)`` for the latest version of every stored profile."""
+    from parsing.store import get_store
+
+    store = get_store()
+    for company in store.companies():
+        stored = store.latest(company)
+        for section, data in stored.profile.items():
+            fetched_at = stored.meta.get(section, {}).get("fetchedAt", stored.created_at)
+            yield stored.company, section, fetched_at, data
+
+
+def jsonl_records(path):
+    """``(company, section, fetchedAt, data)`` for each successful line of a batch output."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if "data" in record:
+                    yield record["company"], record["section"], record["fetchedAt"], record["data"]
+
+
+def export(records, out_dir, fmt="parquet", part=None):
+    """Write ``records`` as partitioned files under ``out_dir``; returns ``{path: rows}``.
+
+    Files are named ``part-<part>``, a timestamp by default; writers running
+    in parallel must pass distinct names.
+    """
+    pa = _pyarrow()
+    normalizer = Normalizer()
+    partitions = defaultdict(list)
+    for company, section, fetched_at, data in records:
+        if section not in SECTIONS:
+            continue
+        fetched = datetime.fromtimestamp(fetched_at, tz=timezone.utc)
+        row = {"company": company, "fetched_at": fetched, **flatten(section, data, normalizer)}
+        partitions[section, fetched.date().isoformat()].append(row)
+
+    written = {}
+    part = part or time.strftime("%Y%m%dT%H%M%S")
+    for (section, day), rows in sorted(partitions.items()):
+        directory = os.path.join(out_dir, f"section={section}", f"fetch_date={day}")
+        os.makedirs(directory, exist_ok=True)
+        table = pa.Table.from_pylist(rows, schema=arrow_schema(section))
+        if fmt == "arrow":
+            path = os.path.join(directory, f"part-{part}.arrow")
+            pa.feather.write_feather(table, path, compression="uncompressed")
+        else:
+            path = os.path.join(directory, f"part-{part}.parquet")
+            pa.parquet.write_table(table, path)
+        written[path] = table.num_rows
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    write = commands.add_parser("write", help="export sections as partitioned files")
+    write.add_argument("out_dir")
+    write.add_argument("--jsonl", help="batch output to export instead of the profile store")
+    write.add_argument("--format", choices=("parquet", "arrow"), default="parquet")
+    columns = commands.add_parser("columns", help="list a section's columns and their kinds")
+    columns.add_argument("section", choices=list(SECTIONS))
+    args = parser.parse_args()
+
+    if args.command == "columns":
+        for column, _keys, kinds in section_columns(args.section):
+            print(f"{column:<50} {json.dumps(kinds)}")
+        return
+
+    records = jsonl_records(args.jsonl) if args.jsonl else store_records()
+    try:
+        written = export(records, args.out_dir, args.format)
+    except ImportError as exc:
+        raise SystemExit(str(exc))
+    for path, rows in written.items():
+        print(f"{rows:>6}  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Pull the JSON object out of a model reply.
+
+Replies are not always a clean fenced block: the model drops the fences,
+keeps a ``json`` language tag, adds prose around the object, leaves
+trailing commas, types smart quotes or stops before the closing braces.
+``extract_json`` handles all of these in one call:
+
+1. Fast path: ``json.JSONDecoder.raw_decode`` from the first ``{``. This
+   skips fences, language tags and trailing prose for free and runs in C.
+2. Repair path: one scan over the object that turns smart-quote delimiters
+   into ``"``, escapes raw newlines inside strings, drops trailing commas
+   and fixes mismatched closers. If the reply was cut off, the open string
+   and brackets are closed, backing off to earlier member boundaries until
+   the result parses.
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_TRUNCATION_ATTEMPTS = 8
+
+_decoder = json.JSONDecoder()
+_OPEN_QUOTES = '"“”'
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class ExtractionError(ValueError):
+    """The reply does not contain a recoverable JSON object."""
+
+
+def extract_json(content):
+    """Return the first JSON object in ``content``, repairing it if needed."""
+    start = content.find("{")
+    if start < 0:
+        raise ExtractionError(f"no JSON object in reply: {content[:200]!r}")
+
+    # Braces in prose before the fence ("details for {company}") are not the
+    # answer, so the first brace inside the fence is tried first.
+    fence = content.find("```")
+    fenced = content.find("{", fence) if 0 <= fence < content.rfind("{") else -1
+    starts = [s for s in (fenced, start) if s >= 0]
+    for candidate in dict.fromkeys(starts):
+        try:
+            value, _end = _decoder.raw_decode(content, candidate)
+            return value
+        except json.JSONDecodeError:
+            pass
+
+    repaired = repair_json(content[starts[0]:])
+    if repaired is None:
+        raise ExtractionError(f"unrecoverable JSON in reply: {content[start:start + 200]!r}")
+    logger.debug("repaired malformed JSON reply")
+    return repaired
+
+
+def repair_json(text):
+    """Best-effort parse of the JSON object at the start of ``text``, or ``None``."""
+    out = []
+    stack = []
+    cut_points = []
+    in_string = False
+    smart_string = False
+    escape = False
+
+    for char in text:
+        if in_string:
+            if escape:
+                escape = False
+                out.append(char)
+            elif char == "\\":
+                escape = True
+                out.append(char)
+            elif char == ("”" if smart_string else '"'):
+                in_string = False
+                out.append('"')
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            elif char in "\r\t":
+                out.append("\\r" if char == "\r" else "\\t")
+            else:
+                out.append(char)
+        elif char in _OPEN_QUOTES:
+            in_string = True
+            smart_string = char != '"'
+            out.append('"')
+        elif char in "{[":
+            stack.append(char)
+            out.append(char)
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                out.append(_CLOSERS[stack.pop()])
+            if not stack:
+                return _loads("".join(out))
+        elif char == ",":
+            cut_points.append((len(out), tuple(stack)))
+            out.append(char)
+        else:
+            out.append(char)
+
+    # The reply ended inside the object: close whatever is still open.
+    if escape:
+        out.pop()
+    candidates = [(len(out), tuple(stack), in_string)]
+    candidates += [(length, snapshot, False) for length, snapshot in reversed(cut_points)]
+    for length, snapshot, open_string in candidates[:MAX_TRUNCATION_ATTEMPTS]:
+        body = "".join(out[:length])
+        if open_string:
+            body += '"'
+        body = body.rstrip().rstrip(",")
+        if body.endswith(":"):
+            body += " null"
+        value = _loads(body + "".join(_CLOSERS[opener] for opener in reversed(snapshot)))
+        if value is not None:
+            return value
+    return None
+
+
+def _drop_trailing_comma(out):
+    i = len(out)
+    while i and out[i - 1].isspace():
+        i -= 1
+    if i and out[i - 1] == ",":
+        del out[i - 1]
+
+
+def _loads(text):
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
@@ -0,0 +1,68 @@
+"""Fetch a section as parallel per-block requests.
+
+Generation time grows with output length, and the ``core`` prompt alone
+asks for seven top-level blocks in one completion. In fan-out mode each
+top-level key of the schema becomes its own small prompt; the requests run
+in parallel and their blocks are merged back into the usual structure, so
+wall-clock time follows the largest block and smaller models stop
+truncating the document.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from parsing.repair import fragment_schema
+from parsing.schema import top_level_keys
+
+logger = logging.getLogger(__name__)
+
+FANOUT_PROMPT = """
+Analyze the {title} of {company} and provide ONLY the "{key}" block in the following EXACT JSON structure:
+
+{structure}
+
+Return ONLY the JSON object, with no additional text. Ensure all information is specific to {company}, accurate, and follows this exact structure. Use real examples and maintain consistent formatting.
+"""
+
+
+def block_prompt(section, company, key):
+    from parsing.sections import SECTIONS
+
+    structure = json.dumps(fragment_schema(section, [key]), indent=2, ensure_ascii=False)
+    return FANOUT_PROMPT.format(
+        title=SECTIONS[section].TITLE,
+        company=company,
+        key=key,
+        structure=structure.replace("the company", company),
+    )
+
+
+def fetch_fanout(section, company, complete, labels=None):
+    """Fetch every top-level block of ``section`` in parallel and merge them.
+
+    ``complete(prompt, labels)`` returns the parsed JSON of one reply. Blocks
+    that fail are left out (validation reports them as missing); if every
+    block fails the last error is raised.
+    """
+    keys = top_level_keys(section)
+    labels = dict(labels or {}, kind="fanout")
+    data = {}
+    error = None
+    with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        futures = {
+            key: executor.submit(complete, block_prompt(section, company, key), labels)
+            for key in keys
+        }
+        for key, future in futures.items():
+            try:
+                fragment = future.result()
+            except Exception as exc:
+                logger.warning("%s.%s failed for %s: %r", section, key, company, exc)
+                error = exc
+                continue
+            # Models sometimes return the block itself instead of {key: block}.
+            data[key] = fragment.get(key, fragment) if isinstance(fragment, dict) else fragment
+    if not data and error is not None:
+        raise error
+    return data
@@ -0,0 +1,149 @@
+"""Per-call token, cost and latency accounting for OpenRouter requests.
+
+The shared client records one row per chat completion: company, section,
+model, prompt/completion tokens and cost from the response ``usage`` block,
+time to first byte (first streamed token when streaming) and total latency.
+Rows go to a local SQLite file next to the response cache.
+
+    python -m parsing.metrics report
+    python -m parsing.metrics report --since 24 --by model
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from parsing.cache import CACHE_DIR
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "metrics.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    ts REAL NOT NULL,
+    company TEXT,
+    section TEXT,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER,
+    ttfb_ms REAL,
+    total_ms REAL NOT NULL,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    cost REAL
+);
+CREATE INDEX IF NOT EXISTS calls_ts ON calls (ts);
+"""
+
+COLUMNS = ("ts", "company", "section", "kind", "model", "status", "attempts", "ttfb_ms",
+           "total_ms", "prompt_tokens", "completion_tokens", "cost")
+
+
+class MetricsSink:
+    """Append-only SQLite table of calls, safe to share between threads."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def record(self, model, status, total_ms, labels=None, attempts=None, ttfb_ms=None,
+               usage=None):
+        labels = labels or {}
+        usage = usage or {}
+        row = (time.time(), labels.get("company"), labels.get("section"),
+               labels.get("kind", "section"), model, status, attempts, ttfb_ms, total_ms,
+               usage.get("prompt_tokens"), usage.get("completion_tokens"), usage.get("cost"))
+        with self._lock:
+            self._db.execute(f"INSERT INTO calls VALUES ({', '.join('?' * len(COLUMNS))})", row)
+
+    def rows(self, since=None):
+        """Recorded calls as dicts, optionally only those after ``since`` (epoch)."""
+        query = f"SELECT {', '.join(COLUMNS)} FROM calls"
+        params = ()
+        if since is not None:
+            query += " WHERE ts >= ?"
+            params = (since,)
+        with self._lock:
+            return [dict(zip(COLUMNS, row)) for row in self._db.execute(query, params)]
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of ``values`` (``q`` in 0..100), or ``None``."""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def summarize(rows, by="section"):
+    """``{group: stats}`` with call counts, latency percentiles and token totals."""
+    groups = {}
+    for row in rows:
+        groups.setdefault(row[by] or "-", []).append(row)
+    summary = {}
+    for group, calls in sorted(groups.items()):
+        ok = [c for c in calls if c["status"] == "ok"]
+        summary[group] = {
+            "calls": len(calls),
+            "errors": len(calls) - len(ok),
+            "p50_ms": percentile([c["total_ms"] for c in ok], 50),
+            "p95_ms": percentile([c["total_ms"] for c in ok], 95),
+            "p50_ttfb_ms": percentile([c["ttfb_ms"] for c in ok], 50),
+            "p95_ttfb_ms": percentile([c["ttfb_ms"] for c in ok], 95),
+            "prompt_tokens": sum(c["prompt_tokens"] or 0 for c in ok),
+            "completion_tokens": sum(c["completion_tokens"] or 0 for c in ok),
+            "p50_completion_tokens": percentile([c["completion_tokens"] for c in ok], 50),
+            "p95_completion_tokens": percentile([c["completion_tokens"] for c in ok], 95),
+            "cost": sum(c["cost"] or 0 for c in ok),
+        }
+    return summary
+
+
+_default_sink = None
+_default_sink_lock = threading.Lock()
+
+
+def get_sink():
+    """Process-wide sink at ``DEFAULT_PATH``, opened on first use."""
+    global _default_sink
+    with _default_sink_lock:
+        if _default_sink is None:
+            _default_sink = MetricsSink()
+        return _default_sink
+
+
+def _fmt(value, digits=0):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("--since", type=float, help="only the last N hours")
+    parser.add_argument("--by", choices=["section", "model", "kind", "company"],
+                        default="section")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    since = time.time() - args.since * 3600 if args.since else None
+    summary = summarize(MetricsSink(args.path).rows(since), args.by)
+    print(f"{args.by:<12} {'calls':>6} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p50 ttfb':>9} {'p95 ttfb':>9} {'prompt tok':>11} {'compl tok':>10} "
+          f"{'p95 compl':>10} {'cost $':>8}")
+    for group, s in summary.items():
+        print(f"{group:<12} {s['calls']:>6} {s['errors']:>4} {_fmt(s['p50_ms']):>8} "
+              f"{_fmt(s['p95_ms']):>8} {_fmt(s['p50_ttfb_ms']):>9} {_fmt(s['p95_ttfb_ms']):>9} "
+              f"{s['prompt_tokens']:>11} {s['completion_tokens']:>10} "
+              f"{_fmt(s['p95_completion_tokens']):>10} {s['cost']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
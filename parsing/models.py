@@ -0,0 +1,154 @@
+"""Compact record classes and a partial-data validator for every section.
+
+One ``__slots__`` dataclass is generated per object in each section schema
+(``CoreSection``, ``CoreBasicIdentity``, ``CoreBasicIdentityKeyPeople``,
+...), so thousands of profiles held in memory cost a fraction of the
+equivalent dict-of-dicts. Every field defaults to ``None`` so partial
+sections still load; ``parsing.schema.validate`` reports what is missing or
+malformed by path.
+
+    python -m parsing.models validate profiles.jsonl
+    python -m parsing.models footprint profiles.jsonl
+"""
+
+import argparse
+import json
+import keyword
+import tracemalloc
+from dataclasses import field, make_dataclass
+
+from parsing.schema import section_schema, validate
+from parsing.sections import SECTIONS
+
+SECTION_MODELS = {}
+
+# cls -> [(attribute, json key, child spec)], where a child spec is
+# None (scalar), ("object", cls) or ("array", cls-or-None).
+_SPECS = {}
+
+
+def _camel(key):
+    return key[:1].upper() + key[1:]
+
+
+def _attribute(key):
+    return key + "_" if keyword.iskeyword(key) else key
+
+
+def _child_spec(name, shape):
+    if isinstance(shape, dict):
+        return ("object", _build_model(name, shape))
+    if isinstance(shape, list):
+        item = shape[0] if shape else None
+        return ("array", _build_model(name, item) if isinstance(item, dict) else None)
+    return None
+
+
+def _build_model(name, shape, prefix=None):
+    prefix = name if prefix is None else prefix
+    spec = [(_attribute(key), key, _child_spec(prefix + _camel(key), sub))
+            for key, sub in shape.items()]
+    cls = make_dataclass(
+        name,
+        [(attribute, object, field(default=None)) for attribute, _key, _child in spec],
+        slots=True,
+    )
+    cls.__module__ = __name__
+    globals()[name] = cls
+    _SPECS[cls] = spec
+    return cls
+
+
+for _section in SECTIONS:
+    SECTION_MODELS[_section] = _build_model(
+        _camel(_section) + "Section", section_schema(_section), prefix=_camel(_section)
+    )
+
+
+def _load(child, value):
+    if child is None or value is None:
+        return value
+    kind, cls = child
+    if kind == "object":
+        return _from_dict(cls, value) if isinstance(value, dict) else value
+    if not isinstance(value, list) or cls is None:
+        return value
+    return [_from_dict(cls, item) if isinstance(item, dict) else item for item in value]
+
+
+def _from_dict(cls, data):
+    return cls(**{attribute: _load(child, data.get(key)) for attribute, key, child in _SPECS[cls]})
+
+
+def from_dict(section, data):
+    """Build the section's record from parsed JSON; unknown keys are dropped."""
+    return _from_dict(SECTION_MODELS[section], data)
+
+
+def _dump(value):
+    if type(value) in _SPECS:
+        return to_dict(value)
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+def to_dict(record):
+    """Inverse of ``from_dict``; fields that are ``None`` are left out."""
+    data = {}
+    for attribute, key, _child in _SPECS[type(record)]:
+        value = getattr(record, attribute)
+        if value is not None:
+            data[key] = _dump(value)
+    return data
+
+
+def _read_records(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if record.get("section") in SECTIONS and isinstance(record.get("data"), dict):
+                    yield record
+
+
+def _footprint(load):
+    tracemalloc.start()
+    held = load()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, len(held)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["validate", "footprint"])
+    parser.add_argument("path", help="JSONL of {company, section, data} records (batch output)")
+    args = parser.parse_args()
+
+    if args.command == "validate":
+        for record in _read_records(args.path):
+            for issue in validate(record["section"], record["data"]):
+                print(f"{record['company']}\t{record['section']}\t{issue.kind}\t{issue.path}")
+        return
+
+    lines = [json.dumps(record) for record in _read_records(args.path)]
+
+    def as_dicts():
+        return [json.loads(line)["data"] for line in lines]
+
+    def as_records():
+        held = []
+        for line in lines:
+            record = json.loads(line)
+            held.append(from_dict(record["section"], record["data"]))
+        return held
+
+    dict_bytes, count = _footprint(as_dicts)
+    record_bytes, _count = _footprint(as_records)
+    print(f"{count} sections: dicts {dict_bytes / 1e6:.1f} MB, "
+          f"records {record_bytes / 1e6:.1f} MB ({record_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Parse the free-text numbers in parsed sections into typed values.
+
+Models answer numeric fields with text such as "70,000+", "~85%",
+"$1.2B", "₹500 Cr", "10-15" or "4.2/5". ``parse_quantity`` reads one of
+these into a ``Quantity`` with its value, range, unit and whether it was
+approximate. Which leaves are numeric comes from their description in the
+prompt's example JSON (``leaf_kind``), so ``Normalizer.normalize`` can turn a
+whole section into typed values. A ``Normalizer`` parses each distinct
+string once, so normalising a batch of profiles costs one parse per distinct
+value rather than one per row:
+
+    python -m parsing.normalize results.jsonl --section jobs
+    python -m parsing.normalize --parse "approx. \\$1.2-1.5B"
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+from parsing.schema import OPTIONAL_MARKER, section_schema
+from parsing.sections import SECTIONS
+
+STRING = "string"
+PERCENT = "percent"
+SCORE = "score"
+COUNT = "count"
+YEAR = "year"
+CURRENCY = "currency"
+BOOLEAN = "boolean"
+
+# First match wins; checked against the lower-cased leaf description.
+LEAF_KINDS = [
+    (re.compile(r"\bin \d+ words\b"), STRING),
+    (re.compile(r"^true/false$"), BOOLEAN),
+    (re.compile(r"\bpercentage\b"), PERCENT),
+    (re.compile(r"\bscore\b"), SCORE),
+    (re.compile(r"\bamount\b|\bmarket cap\b|\bbonus\b|\bsalary\b|\bstipend\b"), CURRENCY),
+    (re.compile(r"^(total |average )?number\b|^numerical\b"), COUNT),
+    (re.compile(r"^(total )?(global )?employees\b|\bemployees in\b"), COUNT),
+    (re.compile(r"^year\b"), YEAR),
+]
+
+MAGNITUDES = {
+    "k": 1e3, "thousand": 1e3,
+    "m": 1e6, "mn": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9,
+    "t": 1e12, "tn": 1e12, "trillion": 1e12,
+    "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5,
+    "lpa": 1e5, "lakh per annum": 1e5, "lakhs per annum": 1e5,
+    "cr": 1e7, "crore": 1e7, "crores": 1e7,
+}
+CURRENCIES = {
+    "$": "USD", "usd": "USD", "us$": "USD",
+    "₹": "INR", "inr": "INR", "rs": "INR", "rs.": "INR",
+    "€": "EUR", "eur": "EUR",
+    "£": "GBP", "gbp": "GBP",
+}
+
+_MAGNITUDE = "|".join(sorted(MAGNITUDES, key=len, reverse=True))
+QUANTITY = re.compile(
+    rf"(?<![\d.])(?P<sign>[-−])?(?P<low>\d[\d,]*(?:\.\d+)?)\s*(?P<low_mag>{_MAGNITUDE})?\b"
+    rf"(?:(?P<low_percent>\s*%)?\s*(?:-|–|—|to)\s*[$₹€£]?\s*"
+    rf"(?P<high>\d[\d,]*(?:\.\d+)?)\s*(?P<high_mag>{_MAGNITUDE})?\b)?"
+    r"(?P<plus>\s*\+)?(?P<percent>\s*(?:%|percent\b))?",
+    re.IGNORECASE,
+)
+FOUR_DIGITS = re.compile(r"(?<![\d.])\d{4}(?!\d)")
+CURRENCY_MARK = re.compile(r"us\$|[$₹€£]|\b(?:usd|inr|eur|gbp|rs\.?)(?![a-z])", re.IGNORECASE)
+APPROXIMATE = re.compile(
+    r"[~≈]|\b(?:approx\w*|about|around|nearly|almost|roughly|over|more than|estimated|est)\b",
+    re.IGNORECASE,
+)
+TRUE_WORDS = {"true", "yes", "y", "1"}
+FALSE_WORDS = {"false", "no", "n", "0"}
+
+Quantity = namedtuple("Quantity", "value low high unit approx")
+
+
+def leaf_kind(description):
+    description = str(description).replace(OPTIONAL_MARKER, "").strip().lower()
+    for pattern, kind in LEAF_KINDS:
+        if pattern.search(description):
+            return kind
+    return STRING
+
+
+def shape_kinds(shape):
+    """Mirror a schema ``shape`` with each leaf replaced by its kind."""
+    if isinstance(shape, dict):
+        return {key: shape_kinds(sub) for key, sub in shape.items()}
+    if isinstance(shape, list):
+        return [shape_kinds(shape[0]) if shape else STRING]
+    return leaf_kind(shape)
+
+
+def _number(digits, magnitude):
+    return float(digits.replace(",", "")) * MAGNITUDES.get((magnitude or "").lower(), 1)
+
+
+def parse_quantity(value, currency=False):
+    """Read the first quantity in ``value``; ``None`` if it has no number.
+
+    Ranges ("10-15", "$1.2-1.5B", "50.5%–60%") give their midpoint as
+    ``value``; a magnitude on the upper bound applies to both. ``unit`` is
+    ``"%"``, an ISO currency code or ``None``; a trailing ``+`` or words like
+    "approx." and "over" set ``approx``. With ``currency``, the quantity
+    nearest a currency mark is read instead of the first one, so "Q3 2024
+    revenue $40B" gives 40B rather than 3.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return Quantity(float(value), float(value), float(value), None, False)
+    text = str(value)
+    mark = CURRENCY_MARK.search(text) if currency else None
+    if mark is None:
+        match = QUANTITY.search(text)
+    else:
+        match = min(QUANTITY.finditer(text), default=None,
+                    key=lambda m: max(m.start() - mark.end(), mark.start() - m.end()))
+    if not match:
+        return None
+    low_mag, high_mag = match.group("low_mag"), match.group("high_mag")
+    low = _number(match.group("low"), low_mag or high_mag)
+    if match.group("sign"):
+        low = -low
+    high = _number(match.group("high"), high_mag) if match.group("high") else low
+    if high < low:
+        low, high = high, low
+    if match.group("percent") or match.group("low_percent"):
+        unit = "%"
+    else:
+        currency = CURRENCY_MARK.search(text)
+        unit = CURRENCIES[currency.group().lower()] if currency else None
+    approx = bool(match.group("plus") or APPROXIMATE.search(text))
+    return Quantity((low + high) / 2, low, high, unit, approx)
+
+
+def to_boolean(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    word = str(value).strip().lower().split(" ")[0].strip(".,")
+    if word in TRUE_WORDS:
+        return True
+    if word in FALSE_WORDS:
+        return False
+    return None
+
+
+class Normalizer:
+    """Converts leaf values to typed values, parsing each distinct string once."""
+
+    def __init__(self):
+        self._quantities = {}
+
+    def quantity(self, value, currency=False):
+        if not isinstance(value, str):
+            return parse_quantity(value)
+        try:
+            return self._quantities[value, currency]
+        except KeyError:
+            quantity = self._quantities[value, currency] = parse_quantity(value, currency)
+            return quantity
+
+    @property
+    def distinct(self):
+        return len(self._quantities)
+
+    def coerce(self, kind, value):
+        """The typed value of one leaf: a float, int, bool, currency dict or string."""
+        if kind == STRING:
+            if value is None or isinstance(value, str):
+                return value
+            return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+        if kind == BOOLEAN:
+            return to_boolean(value)
+        if kind == YEAR:
+            # Not a range: the fiscal year "2024-25" is 2024, not 25.
+            year = FOUR_DIGITS.search(str(value)) if value is not None else None
+            return int(year.group()) if year else None
+        quantity = self.quantity(value, kind == CURRENCY)
+        if quantity is None:
+            return None
+        if kind == CURRENCY:
+            currency = quantity.unit if quantity.unit != "%" else None
+            return {"value": quantity.value, "currency": currency}
+        if kind == COUNT:
+            return int(quantity.value)
+        return quantity.value
+
+    def convert(self, kinds, value):
+        """Coerce a JSON value to match ``shape_kinds`` output, dropping unknown keys."""
+        if isinstance(kinds, dict):
+            if not isinstance(value, dict):
+                return None
+            return {key: self.convert(sub, value.get(key)) for key, sub in kinds.items()}
+        if isinstance(kinds, list):
+            if value is None:
+                return None
+            items = value if isinstance(value, list) else [value]
+            return [self.convert(kinds[0], item) for item in items]
+        return self.coerce(kinds, value)
+
+    def normalize(self, section, data):
+        """``data`` with every leaf of ``section``'s schema converted to its type."""
+        return self.convert(section_kinds(section), data)
+
+
+@lru_cache(maxsize=None)
+def section_kinds(section):
+    return shape_kinds(section_schema(section))
+
+
+def normalize_batch(section, records):
+    """Normalise a list of parsed ``section`` dicts with one shared ``Normalizer``."""
+    normalizer = Normalizer()
+    return [normalizer.normalize(section, data) for data in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", help="batch output JSONL to normalise")
+    parser.add_argument("--section", choices=list(SECTIONS), help="only this section")
+    parser.add_argument("--parse", metavar="TEXT", help="parse a single value and exit")
+    args = parser.parse_args()
+
+    if args.parse is not None:
+        quantity = parse_quantity(args.parse)
+        print(json.dumps(quantity._asdict() if quantity else None, ensure_ascii=False))
+        return
+    if not args.path:
+        parser.error("a JSONL path or --parse is required")
+
+    normalizer = Normalizer()
+    with open(args.path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "data" not in record or record["section"] not in SECTIONS:
+                continue
+            if args.section and record["section"] != args.section:
+                continue
+            record["data"] = normalizer.normalize(record["section"], record["data"])
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Client-side rate limiting for OpenRouter requests.
+
+``SharedRateLimiter`` is the limiter every ``parsing.client`` request goes
+through. Its token buckets live in SQLite under ``CACHE_DIR``, so all
+threads and worker processes on the machine draw from one quota. The rate
+adapts to the server: it starts at ``RATE_PER_MINUTE``, rises towards the
+``X-RateLimit-Limit`` ceiling the server reports while calls succeed, halves
+on each 429, and stops all callers until ``Retry-After`` or
+``X-RateLimit-Reset`` when the quota (per minute or per day) is spent.
+Waiters are served by priority, so interactive lookups go ahead of batch and
+refresh jobs:
+
+    python -m parsing.ratelimit status
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from parsing.cache import CACHE_DIR
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "ratelimit.sqlite3")
+RATE_PER_MINUTE = float(os.environ.get("INSIDER_RATE_PER_MINUTE", 20))
+LIMIT_WINDOW = 60
+MIN_RATE = 1 / 60
+DECREASE = 0.5
+INCREASE = 1 / 60
+DEFAULT_BLOCK = 10.0
+POLL_INTERVAL = 0.05
+MAX_SLEEP = 1.0
+WAITER_TTL = 10.0
+
+INTERACTIVE = 0
+REFRESH = 5
+BATCH = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    rate REAL NOT NULL,
+    ceiling REAL NOT NULL,
+    burst REAL NOT NULL,
+    blocked_until REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    heartbeat REAL NOT NULL
+);
+"""
+
+_default_priority = INTERACTIVE
+
+
+def set_default_priority(value):
+    """Priority of every request this process makes, e.g. ``BATCH`` for batch runs."""
+    global _default_priority
+    _default_priority = value
+
+
+def current_priority():
+    return _default_priority
+
+
+def _header_number(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def reset_time(value, now):
+    """Epoch seconds of an ``X-RateLimit-Reset`` in epoch ms, epoch s or seconds from now."""
+    if value is None:
+        return None
+    if value > 1e12:
+        return value / 1000
+    if value > 1e9:
+        return value
+    return now + value
+
+
+class SharedRateLimiter:
+    """Adaptive per-host token buckets shared between processes through SQLite."""
+
+    def __init__(self, path=DEFAULT_PATH, rate_per_minute=RATE_PER_MINUTE, burst=1):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _bucket(self, db, host, now):
+        row = db.execute(
+            "SELECT tokens, updated, rate, ceiling, burst, blocked_until FROM buckets "
+            "WHERE host = ?", (host,)
+        ).fetchone()
+        if row is None:
+            row = (self.burst, now, self.rate, self.rate, self.burst, 0.0)
+            db.execute("INSERT INTO buckets VALUES (?, ?, ?, ?, ?, ?, ?)", (host, *row))
+        tokens, updated, rate, ceiling, burst, blocked_until = row
+        tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+        return tokens, rate, ceiling, burst, blocked_until
+
+    def configure(self, url, rate_per_minute):
+        """Set the rate and ceiling for ``url``'s host, e.g. from ``--rate``."""
+        host = urlsplit(url).netloc
+        now = time.time()
+        with self._transaction() as db:
+            tokens, _rate, _ceiling, _burst, _blocked = self._bucket(db, host, now)
+            db.execute(
+                "UPDATE buckets SET tokens = ?, updated = ?, rate = ?, ceiling = ? WHERE host = ?",
+                (tokens, now, rate_per_minute / 60, rate_per_minute / 60, host),
+            )
+
+    def acquire(self, url, priority=None):
+        """Block until a request to ``url`` may be sent."""
+        host = urlsplit(url).netloc
+        priority = current_priority() if priority is None else priority
+        waiter = uuid.uuid4().hex
+        try:
+            while True:
+                wait = self._try_acquire(host, waiter, priority)
+                if wait <= 0:
+                    return
+                time.sleep(min(wait, MAX_SLEEP))
+        finally:
+            with self._lock:
+                self._db.execute("DELETE FROM waiters WHERE id = ?", (waiter,))
+
+    def _try_acquire(self, host, waiter, priority):
+        """Take a token and return 0, or return how long to wait before retrying."""
+        now = time.time()
+        with self._transaction() as db:
+            tokens, rate, _ceiling, _burst, blocked_until = self._bucket(db, host, now)
+            db.execute("DELETE FROM waiters WHERE heartbeat < ?", (now - WAITER_TTL,))
+            db.execute("INSERT OR REPLACE INTO waiters VALUES (?, ?, ?, ?)",
+                       (waiter, host, priority, now))
+            (ahead,) = db.execute(
+                "SELECT COUNT(*) FROM waiters WHERE host = ? AND priority < ?", (host, priority)
+            ).fetchone()
+            if now < blocked_until:
+                wait = blocked_until - now
+            elif ahead:
+                wait = POLL_INTERVAL
+            elif tokens >= 1:
+                tokens -= 1
+                wait = 0
+            else:
+                wait = (1 - tokens) / rate
+            db.execute("UPDATE buckets SET tokens = ?, updated = ? WHERE host = ?",
+                       (tokens, now, host))
+        return wait
+
+    def observe(self, url, status, headers, retry_after=None):
+        """Adapt ``url``'s bucket to a response's status and rate-limit headers."""
+        host = urlsplit(url).netloc
+        now = time.time()
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = reset_time(_header_number(headers, "X-RateLimit-Reset"), now)
+        with self._transaction() as db:
+            tokens, rate, ceiling, _burst, blocked_until = self._bucket(db, host, now)
+            if limit:
+                ceiling = limit / LIMIT_WINDOW
+            if status == 429:
+                rate = max(MIN_RATE, rate * DECREASE)
+                tokens = 0.0
+                if retry_after is not None:
+                    until = now + retry_after
+                else:
+                    until = reset if reset and reset > now else now + DEFAULT_BLOCK
+                blocked_until = max(blocked_until, until)
+            elif 200 <= status < 300:
+                rate = min(ceiling, rate + INCREASE)
+                if remaining is not None and remaining <= 0 and reset and reset > now:
+                    blocked_until = max(blocked_until, reset)
+            db.execute(
+                "UPDATE buckets SET tokens = ?, updated = ?, rate = ?, ceiling = ?, "
+                "blocked_until = ? WHERE host = ?",
+                (tokens, now, min(rate, ceiling), ceiling, blocked_until, host),
+            )
+
+    def status(self):
+        """``{host: {...}}`` with each bucket's state and waiters by priority."""
+        now = time.time()
+        with self._lock:
+            buckets = self._db.execute(
+                "SELECT host, tokens, updated, rate, ceiling, burst, blocked_until FROM buckets"
+            ).fetchall()
+            waiters = self._db.execute(
+                "SELECT host, priority, COUNT(*) FROM waiters WHERE heartbeat >= ? "
+                "GROUP BY host, priority", (now - WAITER_TTL,)
+            ).fetchall()
+        status = {}
+        for host, tokens, updated, rate, ceiling, burst, blocked_until in buckets:
+            status[host] = {
+                "per_minute": round(rate * 60, 2),
+                "ceiling_per_minute": round(ceiling * 60, 2),
+                "tokens": round(min(burst, tokens + (now - updated) * rate), 2),
+                "blocked_for": round(max(0.0, blocked_until - now), 1),
+                "waiting": {},
+            }
+        for host, level, count in waiters:
+            status.setdefault(host, {"waiting": {}})["waiting"][level] = count
+        return status
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """The process-wide ``SharedRateLimiter`` at ``DEFAULT_PATH``."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = SharedRateLimiter()
+        return _limiter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="show the shared buckets and their waiters")
+    set_rate = commands.add_parser("set", help="set a host's rate")
+    set_rate.add_argument("url")
+    set_rate.add_argument("per_minute", type=float)
+    args = parser.parse_args()
+
+    limiter = get_limiter()
+    if args.command == "set":
+        limiter.configure(args.url, args.per_minute)
+    for host, state in limiter.status().items():
+        print(host, state)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Incremental refresh of stored company profiles.
+
+Loads each company's latest profile and re-queries only the sections that
+are stale under ``REFRESH_POLICY`` (news daily, jobs weekly, the rest
+monthly) or whose inputs changed since they were fetched (a new template
+version or model). The refreshed profile is saved as a new version with its
+diff against the previous one. Companies with no stored profile are fetched
+in full. A company none of whose stale sections could be fetched is reported
+as failed and makes the command exit non-zero:
+
+    python -m parsing.refresh --all
+    python -m parsing.refresh --companies companies.csv --workers 4
+    python -m parsing.refresh meta --force news
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from parsing import client, templates
+from parsing.batch import read_companies
+from parsing.cache import DAY, get_cache
+from parsing.canonical import canonical_name
+from parsing.engine import fetch_profile
+from parsing.ratelimit import REFRESH, set_default_priority
+from parsing.sections import SECTIONS
+from parsing.store import get_store
+
+logger = logging.getLogger(__name__)
+
+REFRESH_POLICY = {
+    "news": 1 * DAY,
+    "jobs": 7 * DAY,
+    "interview": 30 * DAY,
+    "tech": 30 * DAY,
+    "culture": 30 * DAY,
+    "ways": 30 * DAY,
+    "core": 30 * DAY,
+}
+DEFAULT_WORKERS = 4
+
+
+class RefreshError(Exception):
+    """None of a company's stale sections could be fetched."""
+
+
+def stale_sections(stored, model=client.MODEL, now=None, force=()):
+    """Sections of a ``StoredProfile`` (or ``None``) that need re-fetching."""
+    if stored is None:
+        return list(SECTIONS)
+    now = time.time() if now is None else now
+    stale = []
+    for section in SECTIONS:
+        meta = stored.meta.get(section)
+        if (section in force or meta is None or section not in stored.profile
+                or now - meta["fetchedAt"] > REFRESH_POLICY[section]
+                or meta.get("templateVersion") != templates.version(section)
+                or meta.get("model") != model):
+            stale.append(section)
+    return stale
+
+
+async def refresh_company(store, company, model=client.MODEL, force=()):
+    """Refresh ``company`` in ``store``; returns the new ``StoredProfile`` or ``None``.
+
+    ``None`` means nothing was stale; ``RefreshError`` is raised if every
+    stale section failed.
+    """
+    company = canonical_name(company)
+    stored = store.latest(company)
+    stale = stale_sections(stored, model, force=force)
+    if not stale:
+        return None
+
+    fetched = await fetch_profile(company, stale, use_cache=False)
+    errors = fetched.pop("errors", {})
+    if not fetched:
+        raise RefreshError(f"no section of {company} could be refreshed: {errors}")
+    for section, data in fetched.items():
+        get_cache().put(company, section, model, templates.version(section), data)
+    return store.update(company, fetched, model)
+
+
+async def refresh_all(store, companies, workers=DEFAULT_WORKERS, force=()):
+    """``(company, result)`` pairs: a ``StoredProfile``, ``None`` or the exception raised."""
+    semaphore = asyncio.Semaphore(workers)
+
+    async def refresh_one(company):
+        async with semaphore:
+            try:
+                return company, await refresh_company(store, company, force=force)
+            except Exception as exc:
+                logger.warning("refresh of %s failed: %r", company, exc)
+                return company, exc
+
+    return await asyncio.gather(*(refresh_one(company) for company in companies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("company", nargs="*")
+    parser.add_argument("--all", action="store_true", help="every company in the store")
+    parser.add_argument("--companies", help="CSV or JSONL file listing companies")
+    parser.add_argument("--force", nargs="+", default=(), choices=list(SECTIONS),
+                        help="re-fetch these sections even if fresh")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="companies refreshed at once")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    set_default_priority(REFRESH)
+
+    store = get_store()
+    companies = list(args.company)
+    if args.companies:
+        companies += read_companies(args.companies)
+    if args.all:
+        companies += store.companies()
+
+    failed = 0
+    for company, saved in asyncio.run(refresh_all(store, companies, args.workers, args.force)):
+        if isinstance(saved, Exception):
+            print(f"{company}: failed ({type(saved).__name__}: {saved})")
+            failed += 1
+            continue
+        if saved is None:
+            print(f"{company}: up to date")
+            continue
+        print(f"{company}: version {saved.version}, {len(saved.diff)} changed fields")
+        for change in saved.diff[:20]:
+            print(f"  {change['op']:<7} {change['path']}")
+    if failed:
+        raise SystemExit(f"{failed} of {len(companies)} companies failed to refresh")
+
+
+if __name__ == "__main__":
+    main()
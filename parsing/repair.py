@@ -0,0 +1,110 @@
+"""Re-query only the parts of a section the model left out.
+
+When a parsed section fails validation, rerunning the whole prompt costs
+the full completion again. Instead the failing paths are collapsed to the
+smallest set of fragments to ask for (a missing ``legalDetails.stockInfo``
+or a malformed ``questionStats``; a bad array item re-requests its array),
+a follow-up prompt carries just those fragments' schema, and the answer is
+merged back into the section.
+"""
+
+import json
+import logging
+
+import requests
+
+from parsing import client
+from parsing.extract import ExtractionError, extract_json
+from parsing.schema import section_schema, validate
+
+logger = logging.getLogger(__name__)
+
+REPAIR_PROMPT = """
+Some fields are missing from the {title} data for {company}. Provide ONLY these fields in the following EXACT JSON structure:
+
+{structure}
+
+Ensure all information is specific to {company}, accurate, and follows this exact structure. Use real examples and maintain consistent formatting.
+"""
+
+
+def repair_paths(issues):
+    """Collapse validation issues into the fragment paths to re-request."""
+    paths = []
+    for issue in issues:
+        path = issue.path.split("[", 1)[0]
+        if not path:
+            continue
+        if any(path == p or path.startswith(p + ".") for p in paths):
+            continue
+        paths = [p for p in paths if not p.startswith(path + ".")]
+        paths.append(path)
+    return paths
+
+
+def fragment_schema(section, paths):
+    """The section schema pruned down to ``paths``, nesting preserved."""
+    schema = section_schema(section)
+    fragment = {}
+    for path in paths:
+        *parents, leaf = path.split(".")
+        shape, target = schema, fragment
+        for key in parents:
+            shape = shape[key]
+            target = target.setdefault(key, {})
+        target[leaf] = shape[leaf]
+    return fragment
+
+
+def repair_prompt(section, company, paths):
+    from parsing.sections import SECTIONS
+
+    structure = json.dumps(fragment_schema(section, paths), indent=2, ensure_ascii=False)
+    return REPAIR_PROMPT.format(
+        title=SECTIONS[section].TITLE,
+        company=company,
+        structure=structure.replace("the company", company),
+    )
+
+
+def merge_fragment(data, fragment, paths):
+    """Copy each of ``paths`` from ``fragment`` into ``data`` in place."""
+    for path in paths:
+        *parents, leaf = path.split(".")
+        source = fragment
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+        if not isinstance(source, dict) or source.get(leaf) is None:
+            continue
+        target = data
+        for key in parents:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[leaf] = source[leaf]
+    return data
+
+
+def repair_section(section, company, data, model=client.MODEL, max_rounds=1):
+    """Fill in what ``data`` is missing with follow-up prompts.
+
+    Returns the remaining validation issues; ``data`` is updated in place.
+    Repair is best-effort: if a follow-up call fails, ``data`` is kept as it
+    is and its issues are returned.
+    """
+    issues = validate(section, data)
+    for _ in range(max_rounds):
+        paths = repair_paths(issues)
+        if not paths:
+            break
+        logger.info("re-requesting %s for %s: %s", section, company, ", ".join(paths))
+        labels = {"company": company, "section": section, "kind": "repair"}
+        try:
+            content = client.chat(repair_prompt(section, company, paths), model, labels)
+            fragment = extract_json(content)
+        except (client.OpenRouterError, ExtractionError, requests.RequestException) as exc:
+            logger.warning("could not repair %s for %s: %s", section, company, exc)
+            break
+        merge_fragment(data, fragment, paths)
+        issues = validate(section, data)
+    return issues
@@ -0,0 +1,171 @@
+"""Re-parse a directory of raw completions on every core.
+
+Reads JSONL files of raw responses (``{"company", "section", "content"}``
+rows, optionally with ``fetchedAt`` and ``kind``, as written by
+``python -m parsing.archive dump``), then extracts, validates and
+normalises each one. Repair and fan-out fragments are skipped, since they
+are not whole sections. The files are cut into byte ranges of about
+``--chunk-mb``; a worker process opens its file, seeks to its range and
+writes its own output part, so only the range and a small summary cross
+process boundaries. Use this to rebuild every parsed section after a schema
+or extractor change:
+
+    python -m parsing.reprocess raw/ reparsed/ --workers 16
+    python -m parsing.reprocess raw/ exports/ --format parquet
+
+JSONL output mirrors ``parsing.batch`` records with ``data`` normalised by
+``parsing.normalize`` (or ``error`` if the reply could not be parsed);
+``parquet``/``arrow`` output goes through ``parsing.export``.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from parsing.extract import ExtractionError, extract_json
+from parsing.normalize import Normalizer
+from parsing.schema import validate
+from parsing.sections import SECTIONS
+
+DEFAULT_CHUNK_MB = 8
+SECTION_KINDS = ("section", "stream", "structured")
+
+
+def find_inputs(path, exclude=None):
+    """Every ``.jsonl`` file under ``path`` (or ``path`` itself), sorted.
+
+    The ``exclude`` directory (the output directory) is not descended into,
+    so a rerun never reprocesses its own output.
+    """
+    if not os.path.isdir(path):
+        return [path]
+    excluded = os.path.realpath(exclude) if exclude else None
+    paths = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = [d for d in dirs if os.path.realpath(os.path.join(root, d)) != excluded]
+        paths.extend(os.path.join(root, name) for name in names
+                     if name.endswith((".jsonl", ".ndjson")))
+    return sorted(paths)
+
+
+def plan_chunks(paths, chunk_bytes):
+    """``(path, start, end)`` byte ranges of roughly ``chunk_bytes`` each."""
+    chunks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, size, chunk_bytes):
+            chunks.append((path, start, min(size, start + chunk_bytes)))
+    return chunks
+
+
+def read_range(path, start, end):
+    """Yield the lines that start inside ``[start, end)`` of ``path``."""
+    with open(path, "rb") as f:
+        if start:
+            # Land on the first line boundary at or after ``start``.
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+
+def parse_record(record, normalizer):
+    """``(output record, outcome)`` for one raw response."""
+    section = record.get("section")
+    out = {"company": record.get("company"), "section": section,
+           "fetchedAt": record.get("fetchedAt")}
+    if section not in SECTIONS:
+        out["error"] = f"unknown section {section!r}"
+        return out, "skipped", None
+    if record.get("kind", "section") not in SECTION_KINDS:
+        out["error"] = f"{record['kind']} fragment, not a whole section"
+        return out, "skipped", None
+    try:
+        data = extract_json(record["content"])
+    except (ExtractionError, KeyError, TypeError) as exc:
+        out["error"] = f"{type(exc).__name__}: {exc}"
+        return out, "parse_failures", None
+    outcome = "schema_issues" if validate(section, data) else "ok"
+    out["data"] = normalizer.normalize(section, data)
+    return out, outcome, data
+
+
+def process_chunk(index, path, start, end, out_dir, fmt):
+    """Worker: parse one byte range and write its output part; returns counts."""
+    normalizer = Normalizer()
+    counts = Counter()
+    exported = []
+    part = f"{index:06d}"
+    output = None
+    if fmt == "jsonl":
+        output = open(os.path.join(out_dir, f"part-{part}.jsonl"), "w", encoding="utf-8")
+    try:
+        for line in read_range(path, start, end):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                counts["bad_lines"] += 1
+                continue
+            out, outcome, data = parse_record(record, normalizer)
+            counts["records"] += 1
+            counts[outcome] += 1
+            if output is not None:
+                output.write(json.dumps(out, ensure_ascii=False) + "\n")
+            elif data is not None:
+                exported.append((out["company"], out["section"],
+                                 out["fetchedAt"] or time.time(), data))
+    finally:
+        if output is not None:
+            output.close()
+    if exported:
+        from parsing.export import export
+
+        export(exported, out_dir, fmt, part)
+    return counts
+
+
+def reprocess(paths, out_dir, workers=None, chunk_bytes=DEFAULT_CHUNK_MB << 20, fmt="jsonl"):
+    """Process ``paths`` on a pool of ``workers`` processes; returns total counts."""
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = plan_chunks(paths, chunk_bytes)
+    totals = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(process_chunk, index, path, start, end, out_dir, fmt)
+                   for index, (path, start, end) in enumerate(chunks)]
+        for future in as_completed(futures):
+            totals.update(future.result())
+    totals["chunks"] = len(chunks)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="directory (or file) of raw response JSONL")
+    parser.add_argument("out_dir")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_MB)
+    parser.add_argument("--format", choices=("jsonl", "parquet", "arrow"), default="jsonl")
+    args = parser.parse_args()
+
+    paths = find_inputs(args.input, args.out_dir)
+    started = time.perf_counter()
+    totals = reprocess(paths, args.out_dir, args.workers, int(args.chunk_mb * (1 << 20)),
+                       args.format)
+    elapsed = time.perf_counter() - started
+    print(f"{len(paths)} files, {totals['chunks']} chunks, {totals['records']} records "
+          f"in {elapsed:.1f}s ({totals['records'] / elapsed:.0f}/s) on {args.workers} workers")
+    print(f"ok {totals['ok']}, schema issues {totals['schema_issues']}, "
+          f"parse failures {totals['parse_failures']}, skipped {totals['skipped']}, "
+          f"bad lines {totals['bad_lines']}")
+
+
+if __name__ == "__main__":
+    main()
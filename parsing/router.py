@@ -0,0 +1,162 @@
+"""Multi-model routing with hedged requests.
+
+Free-tier models have long latency tails. ``Router`` sends a section request
+to the preferred model and, if no answer has arrived after that model's p95
+latency for the section, fires a duplicate at the next model. Whichever
+returns a parseable JSON object first wins. The loser is told to stop and
+closes its stream at its next delta; an attempt still waiting for response
+headers cannot be interrupted and keeps its worker thread and connection
+until they arrive (at most ``client.READ_TIMEOUT``). Latencies and the
+hedge timer run from when an attempt's request is sent, not from while it
+waits on the rate limiter, so local queueing neither skews them nor fires
+hedges. Per-model success rates and latencies are tracked per section, so
+the fastest reliable model becomes the primary over time.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from parsing import client
+from parsing.extract import extract_json
+from parsing.metrics import percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODELS = (client.MODEL, "deepseek/deepseek-chat-v3-0324:free")
+DEFAULT_HEDGE_DELAY = 30.0
+MIN_HEDGE_DELAY = 2.0
+SEND_POLL = 0.1
+HEDGE_QUANTILE = 95
+WINDOW = 200
+MIN_SAMPLES = 10
+MIN_SUCCESS_RATE = 0.8
+
+
+class HedgeCancelled(Exception):
+    """Raised inside an attempt whose sibling already won."""
+
+
+class Router:
+    def __init__(self, models=DEFAULT_MODELS, hedge_delay=DEFAULT_HEDGE_DELAY,
+                 quantile=HEDGE_QUANTILE, max_workers=64):
+        self.models = list(models)
+        self.default_hedge_delay = hedge_delay
+        self.quantile = quantile
+        self._latencies = defaultdict(lambda: deque(maxlen=WINDOW))
+        self._outcomes = defaultdict(lambda: deque(maxlen=WINDOW))
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="router")
+
+    def observe(self, model, section, ok, seconds=None):
+        with self._lock:
+            self._outcomes[model, section].append(ok)
+            if ok and seconds is not None:
+                self._latencies[model, section].append(seconds)
+
+    def load_history(self, rows):
+        """Seed the statistics from ``parsing.metrics`` rows.
+
+        ``closed`` rows are streams the caller stopped reading (cancelled
+        hedges), not model failures, and are skipped.
+        """
+        for row in rows:
+            if row["status"] == "closed":
+                continue
+            if row["kind"] == "section" or row["kind"] == "stream":
+                self.observe(row["model"], row["section"], row["status"] == "ok",
+                             row["total_ms"] / 1000)
+
+    def success_rate(self, model, section):
+        with self._lock:
+            outcomes = list(self._outcomes[model, section])
+        return sum(outcomes) / len(outcomes) if outcomes else None
+
+    def latency(self, model, section, q):
+        with self._lock:
+            latencies = list(self._latencies[model, section])
+        return percentile(latencies, q) if len(latencies) >= MIN_SAMPLES else None
+
+    def ranked(self, section):
+        """Models in preference order: reliable ones by p50 latency, then the rest."""
+        def key(model):
+            rate = self.success_rate(model, section)
+            p50 = self.latency(model, section, 50)
+            reliable = rate is not None and rate >= MIN_SUCCESS_RATE and p50 is not None
+            return (not reliable, p50 if reliable else 0, self.models.index(model))
+
+        return sorted(self.models, key=key)
+
+    def hedge_delay(self, model, section):
+        p = self.latency(model, section, self.quantile)
+        return self.default_hedge_delay if p is None else max(MIN_HEDGE_DELAY, p)
+
+    def _attempt(self, model, prompt, section, labels, cancelled, sent):
+        def on_send():
+            sent.append(time.perf_counter())
+
+        stream = client.stream_chat(prompt, model, labels, on_send=on_send)
+        parts = []
+        try:
+            for delta in stream:
+                if cancelled.is_set():
+                    raise HedgeCancelled(model)
+                parts.append(delta)
+            data = extract_json("".join(parts))
+        except HedgeCancelled:
+            raise
+        except Exception:
+            if not cancelled.is_set():
+                self.observe(model, section, False)
+            raise
+        finally:
+            stream.close()
+        self.observe(model, section, True, time.perf_counter() - sent[0])
+        return data
+
+    def fetch_json(self, prompt, section, labels=None):
+        """Return ``(data, model)`` from the first model to answer with valid JSON."""
+        queue = self.ranked(section)
+        delay = self.hedge_delay(queue[0], section)
+        running = {}
+        errors = []
+        # Each attempt appends its send time once the rate limiter lets it out.
+        sends = []
+
+        def launch():
+            model = queue.pop(0)
+            cancelled = threading.Event()
+            sends.append([])
+            future = self._executor.submit(self._attempt, model, prompt, section, labels,
+                                           cancelled, sends[-1])
+            running[future] = (model, cancelled)
+
+        launch()
+        while running:
+            sent = sends[-1]
+            timeout = None
+            if queue:
+                timeout = max(0.0, sent[0] + delay - time.perf_counter()) if sent else SEND_POLL
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if sent and time.perf_counter() >= sent[0] + delay:
+                    logger.info("hedging %s after %.1fs with %s", section, delay, queue[0])
+                    launch()
+                continue
+            for future in done:
+                model, _cancelled = running.pop(future)
+                try:
+                    data = future.result()
+                except Exception as exc:
+                    logger.warning("%s failed on %s: %r", section, model, exc)
+                    errors.append(exc)
+                    continue
+                for _model, cancelled in running.values():
+                    cancelled.set()
+                return data, model
+            if queue and not running:
+                launch()
+        raise errors[-1]
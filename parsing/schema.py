@@ -0,0 +1,76 @@
+"""Section schemas, read from the example JSON in each prompt template.
+
+The example object a prompt asks the model to fill in doubles as the
+section's schema: a dict is an object with those keys, a one-item list is
+an array of that item, an empty list is an array of anything and a string
+is a scalar. Fields whose description says "(if applicable)" are optional.
+
+``validate`` checks a parsed section against its schema and reports each
+missing or malformed field by path (``legalDetails.stockInfo``,
+``timeline[2].year``) so bad sections are caught when they are fetched.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from parsing.extract import extract_json
+
+OPTIONAL_MARKER = "(if applicable)"
+
+Issue = namedtuple("Issue", "path kind")
+MISSING = "missing"
+INVALID = "invalid"
+
+
+@lru_cache(maxsize=None)
+def section_schema(section):
+    """Return the example object from ``section``'s prompt template."""
+    from parsing.sections import build_prompt
+
+    return extract_json(build_prompt(section, "the company"))
+
+
+def top_level_keys(section):
+    return list(section_schema(section))
+
+
+def is_optional(shape):
+    """True for example values the prompt marks "(if applicable)"."""
+    if isinstance(shape, list):
+        return bool(shape) and is_optional(shape[0])
+    return isinstance(shape, str) and OPTIONAL_MARKER in shape
+
+
+def _check(shape, value, path, issues):
+    if isinstance(shape, dict):
+        if not isinstance(value, dict):
+            issues.append(Issue(path, INVALID))
+            return
+        for key, sub in shape.items():
+            sub_path = f"{path}.{key}" if path else key
+            sub_value = value.get(key)
+            if sub_value is None:
+                if not is_optional(sub):
+                    issues.append(Issue(sub_path, MISSING))
+            else:
+                _check(sub, sub_value, sub_path, issues)
+    elif isinstance(shape, list):
+        if not isinstance(value, list):
+            issues.append(Issue(path, INVALID))
+        elif shape:
+            for i, item in enumerate(value):
+                _check(shape[0], item, f"{path}[{i}]", issues)
+    elif isinstance(value, (dict, list)):
+        issues.append(Issue(path, INVALID))
+
+
+def validate(section, data):
+    """Return the ``Issue`` list for a parsed section; empty means it is complete.
+
+    Optional "(if applicable)" fields may be absent, and empty arrays are
+    accepted. Scalars may be any JSON scalar since models mix strings and
+    numbers freely.
+    """
+    issues = []
+    _check(section_schema(section), data, "", issues)
+    return issues
@@ -0,0 +1,133 @@
+"""Registry of the section parsers and the blocking fetch for one section."""
+
+import logging
+import sys
+
+from parsing import client, core, culture, interview, jobs, news, tech, templates, ways
+from parsing.cache import get_cache
+from parsing.canonical import canonical_name
+from parsing.extract import extract_json
+from parsing.fanout import fetch_fanout
+from parsing.repair import repair_section
+from parsing.schema import validate
+from parsing.singleflight import get_flights
+from parsing.stream import TopLevelParser
+from parsing.structured import fetch_structured
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = {
+    module.SECTION: module
+    for module in (core, jobs, news, tech, culture, ways, interview)
+}
+
+DEFAULT_COMPANY = "meta"
+
+
+def build_prompt(section, company):
+    """Fill the section's registry template in for ``company``."""
+    return templates.render(section, company)
+
+
+def cached_section(section, company, model=client.MODEL):
+    """Return the cached parse of ``section`` for ``company``, or ``None``."""
+    company = canonical_name(company)
+    return get_cache().get(company, section, model, templates.version(section))
+
+
+def fetch_section(section, company, model=client.MODEL, use_cache=True, repair=False,
+                  router=None, fanout=False, structured=False):
+    """Return the parsed dict for one section of ``company``.
+
+    Served from the response cache when a fresh entry exists; otherwise
+    OpenRouter is queried and the result is cached for the section's TTL.
+    With ``repair``, fields that fail validation are re-requested with a
+    small follow-up prompt instead of rerunning the whole section. A
+    ``parsing.router.Router`` replaces ``model`` with hedged multi-model
+    requests, and ``fanout`` requests each top-level block separately in
+    parallel. Otherwise ``structured`` sends the schema through
+    ``response_format`` with a slim prompt (see ``parsing.structured``).
+    Name variants ("Facebook", "Meta Platforms") are resolved to
+    one canonical company first so they share prompts and cache entries, and
+    concurrent calls for the same section share a single request.
+    """
+    company = canonical_name(company)
+    models = tuple(router.models) if router is not None else (model,)
+    if use_cache:
+        for candidate in models:
+            data = cached_section(section, company, candidate)
+            if data is not None:
+                return data
+    key = (company, section, templates.version(section), models, repair, fanout, structured)
+    return get_flights().do(key, _fetch_section, section, company, model, use_cache,
+                            repair, router, fanout, structured)
+
+
+def _fetch_section(section, company, model, use_cache, repair, router, fanout, structured):
+    if use_cache:
+        # A flight that finished just before this one started has cached it.
+        for candidate in (router.models if router is not None else [model]):
+            data = cached_section(section, company, candidate)
+            if data is not None:
+                return data
+    labels = {"company": company, "section": section}
+
+    def complete(prompt, labels):
+        if router is not None:
+            return router.fetch_json(prompt, section, labels)[0]
+        return extract_json(client.chat(prompt, model, labels))
+
+    if fanout:
+        data = fetch_fanout(section, company, complete, labels)
+    elif router is not None:
+        data, model = router.fetch_json(build_prompt(section, company), section, labels)
+    elif structured:
+        data = fetch_structured(section, company, model, labels, complete)
+    else:
+        data = complete(build_prompt(section, company), labels)
+    if repair:
+        issues = repair_section(section, company, data, model)
+    else:
+        issues = validate(section, data)
+    if issues:
+        logger.warning("%s section for %s has %d schema issues: %s", section, company,
+                       len(issues), ", ".join(f"{i.path} ({i.kind})" for i in issues[:10]))
+    if use_cache:
+        get_cache().put(company, section, model, templates.version(section), data)
+    return data
+
+
+def stream_section(section, company, model=client.MODEL, use_cache=True):
+    """Yield ``(key, value)`` for each top-level block of a section as it completes.
+
+    The completion is requested with ``stream: true`` and parsed incrementally;
+    a cached section is replayed straight from the cache.
+    """
+    company = canonical_name(company)
+    if use_cache:
+        data = cached_section(section, company, model)
+        if data is not None:
+            yield from data.items()
+            return
+    parser = TopLevelParser()
+    labels = {"company": company, "section": section, "kind": "stream"}
+    stream = client.stream_chat(build_prompt(section, company), model, labels,
+                                complete=lambda: parser.done)
+    try:
+        for delta in stream:
+            # Keep reading after the object closes: the usage chunk and [DONE]
+            # follow it, and the client only records and archives a finished stream.
+            if not parser.done:
+                yield from parser.feed(delta)
+    finally:
+        # A consumer that stops after the last block still gets the call recorded.
+        stream.close()
+    # Only a fully closed object is cached; a truncated stream is served once.
+    if use_cache and parser.done:
+        get_cache().put(company, section, model, templates.version(section), parser.result)
+
+
+def main(section):
+    """Command-line entry point shared by ``python -m parsing.<section> [company]``."""
+    company = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_COMPANY
+    SECTIONS[section].show(fetch_section(section, company))
@@ -0,0 +1,341 @@
+"""HTTP API serving cached company sections to the app.
+
+A small asyncio server (standard library only) in front of the response
+cache, so devices stop calling OpenRouter for companies the backend has
+already profiled:
+
+    GET /companies/{name}/{section}
+    GET /companies/{name}/events[?sections=core,tech]
+
+Cached sections are answered straight from ``parsing.cache`` on a small
+pool of its own. On a miss the section is generated on a separate, bounded
+pool through ``fetch_section``, so slow generations never hold up cache
+hits for other companies; its
+single-flight guard makes every concurrent request for the same company
+and section wait on one OpenRouter call. Responses carry a strong ETag over
+the JSON body; a matching ``If-None-Match`` gets ``304 Not Modified`` and
+clients that accept gzip get a compressed body. Names are canonicalised as
+usual, so "facebook" and "Meta" share an entry.
+
+The ``events`` endpoint streams a whole profile as server-sent events over
+a chunked response: cached sections first, then every other section as soon
+as its fetch finishes, so pages can render progressively instead of waiting
+for the slowest section:
+
+    python -m parsing.service --port 8000
+    curl --compressed http://127.0.0.1:8000/companies/meta/tech
+    curl -N http://127.0.0.1:8000/companies/meta/events
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+
+from parsing.client import OpenRouterError
+from parsing.extract import ExtractionError
+from parsing.sections import SECTIONS, cached_section, fetch_section
+from parsing.singleflight import get_flights
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8000
+CACHE_WORKERS = 4
+WORKERS = 16
+MAX_HEADER_BYTES = 16 << 10
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+ENCODED_CACHE_SIZE = 512
+KEEP_ALIVE_SECONDS = 30
+HEARTBEAT_SECONDS = 15
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 500: "Internal Server Error", 502: "Bad Gateway",
+}
+
+Request = namedtuple("Request", "method path query headers")
+Body = namedtuple("Body", "etag raw gzipped")
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def etag_matches(header, etag):
+    """True if an ``If-None-Match`` header value names ``etag`` (weak or strong)."""
+    if header is None:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def accepts_gzip(header):
+    """True unless ``Accept-Encoding`` omits gzip or gives it ``q=0``."""
+    for coding in (header or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            q = params.strip().removeprefix("q=")
+            try:
+                return not params or float(q) > 0
+            except ValueError:
+                return True
+    return False
+
+
+async def read_request(reader):
+    """Parse one request head from ``reader``; ``None`` once the client disconnects."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(400, "request head too large")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length:
+        await reader.readexactly(length)
+    url = urlsplit(target)
+    return Request(method.upper(), unquote(url.path), url.query, headers)
+
+
+class ProfileService:
+    """Routes requests to the cache, falling back to single-flight generation."""
+
+    def __init__(self, workers=WORKERS, cache_workers=CACHE_WORKERS):
+        self.generators = ThreadPoolExecutor(max_workers=workers,
+                                             thread_name_prefix="service-fetch")
+        self.readers = ThreadPoolExecutor(max_workers=cache_workers,
+                                          thread_name_prefix="service-cache")
+        self._encoded = OrderedDict()
+
+    async def cached(self, section, company):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.readers, cached_section, section, company)
+
+    async def generate(self, section, company):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.generators, fetch_section, section, company)
+
+    def encode(self, data):
+        """JSON body, ETag and (lazily) gzipped body for ``data``, memoised by ETag."""
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"%s"' % hashlib.sha256(raw).hexdigest()[:20]
+        body = self._encoded.get(etag)
+        if body is None:
+            body = Body(etag, raw, None)
+            if len(raw) >= GZIP_MIN_BYTES:
+                body = body._replace(gzipped=gzip.compress(raw, GZIP_LEVEL, mtime=0))
+            self._encoded[etag] = body
+            if len(self._encoded) > ENCODED_CACHE_SIZE:
+                self._encoded.popitem(last=False)
+        else:
+            self._encoded.move_to_end(etag)
+        return body
+
+    async def section(self, company, section):
+        if section not in SECTIONS:
+            raise HTTPError(404, f"unknown section {section!r}")
+        data = await self.cached(section, company)
+        if data is None:
+            try:
+                data = await self.generate(section, company)
+            except (OpenRouterError, ExtractionError, requests.RequestException) as exc:
+                logger.warning("could not generate %s for %s: %s", section, company, exc)
+                raise HTTPError(502, f"could not generate {section} for {company}")
+        return data
+
+    async def stream_profile(self, request, writer, company, sections):
+        """Push each section of ``company`` as a server-sent event once it is ready.
+
+        Cached sections are looked up together and sent first; the misses
+        are all started at once and sent in completion order, so the first
+        event is never later than the fastest section. A ``done`` event
+        ends the stream.
+        """
+        unknown = [section for section in sections if section not in SECTIONS]
+        if unknown or not sections:
+            raise HTTPError(404, f"unknown sections {unknown!r}")
+        started = time.perf_counter()
+        hits = await asyncio.gather(*(self.cached(section, company) for section in sections))
+        write_head(writer, request, 200, [
+            ("Content-Type", "text/event-stream; charset=utf-8"),
+            ("Cache-Control", "no-cache"),
+            ("Access-Control-Allow-Origin", "*"),
+            ("Transfer-Encoding", "chunked"),
+        ])
+        if request.method == "HEAD":
+            await writer.drain()
+            return
+        for section, data in zip(sections, hits):
+            if data is not None:
+                await write_chunk(writer, sse_event(
+                    "section", {"section": section, "cached": True, "data": data}, section))
+
+        pending = {}
+        for section, data in zip(sections, hits):
+            if data is None:
+                pending[asyncio.ensure_future(self.generate(section, company))] = section
+        errors = 0
+        while pending:
+            done, _ = await asyncio.wait(pending, timeout=HEARTBEAT_SECONDS,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                # A comment line keeps proxies from timing out an idle stream.
+                await write_chunk(writer, b": waiting\n\n")
+            for future in done:
+                section = pending.pop(future)
+                try:
+                    event = {"section": section, "cached": False, "data": future.result()}
+                except Exception as exc:
+                    # The status line has gone out; report failures in the stream.
+                    logger.warning("could not generate %s for %s: %r", section, company, exc)
+                    errors += 1
+                    await write_chunk(writer, sse_event(
+                        "error", {"section": section, "error": "generation failed"}, section))
+                    continue
+                await write_chunk(writer, sse_event("section", event, section))
+
+        await write_chunk(writer, sse_event("done", {
+            "sections": len(sections) - errors, "errors": errors,
+            "ms": round((time.perf_counter() - started) * 1000),
+        }))
+        await write_chunk(writer, b"")
+
+    async def route(self, request, writer):
+        parts = [part for part in request.path.split("/") if part]
+        if request.method not in ("GET", "HEAD"):
+            raise HTTPError(405, f"{request.method} not allowed")
+        if parts == ["health"]:
+            await send_json(writer, request, 200, {"status": "ok", **get_flights().metrics()})
+            return
+        if len(parts) == 3 and parts[0] == "companies" and parts[2] == "events":
+            sections = parse_qs(request.query).get("sections", [",".join(SECTIONS)])
+            await self.stream_profile(request, writer, parts[1],
+                                      [s for value in sections for s in value.split(",") if s])
+            return
+        if len(parts) == 3 and parts[0] == "companies":
+            data = await self.section(parts[1], parts[2])
+            await send_json(writer, request, 200, data, self.encode(data))
+            return
+        raise HTTPError(404, f"no route for {request.path}")
+
+    async def handle(self, reader, writer):
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), KEEP_ALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as exc:
+                    await send_json(writer, None, exc.status, {"error": str(exc)})
+                    break
+                if request is None:
+                    break
+                try:
+                    await self.route(request, writer)
+                except HTTPError as exc:
+                    await send_json(writer, request, exc.status, {"error": str(exc)})
+                except Exception:
+                    logger.exception("error serving %s", request.path)
+                    await send_json(writer, request, 500, {"error": "internal error"})
+                if request.headers.get("connection", "").lower() == "close":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def send_json(writer, request, status, data, body=None):
+    """Write a JSON response, honouring ``If-None-Match`` and ``Accept-Encoding``."""
+    headers = request.headers if request is not None else {}
+    if body is None:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        body = Body(None, raw, None)
+    extra = [("Content-Type", "application/json; charset=utf-8"),
+             ("Access-Control-Allow-Origin", "*")]
+    payload = body.raw
+    if body.etag is not None:
+        extra += [("ETag", body.etag), ("Cache-Control", "no-cache"),
+                  ("Vary", "Accept-Encoding")]
+        if status == 200 and etag_matches(headers.get("if-none-match"), body.etag):
+            status, payload = 304, b""
+    if payload and body.gzipped is not None and accepts_gzip(headers.get("accept-encoding")):
+        payload = body.gzipped
+        extra.append(("Content-Encoding", "gzip"))
+    if status != 304:
+        extra.insert(0, ("Content-Length", len(payload)))
+    write_head(writer, request, status, extra)
+    if request is None or request.method != "HEAD":
+        writer.write(payload)
+    await writer.drain()
+
+
+def write_head(writer, request, status, headers):
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+    lines += [f"{name}: {value}" for name, value in headers]
+    if request is None or request.headers.get("connection", "").lower() == "close":
+        lines.append("Connection: close")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+def sse_event(event, data, event_id=None):
+    """One server-sent event carrying ``data`` as a single line of JSON."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+async def write_chunk(writer, data):
+    """Write ``data`` as one HTTP/1.1 chunk and flush it to the client."""
+    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, workers=WORKERS):
+    service = ProfileService(workers)
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_HEADER_BYTES)
+    logger.info("serving on %s", ", ".join(str(s.getsockname()) for s in server.sockets))
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="threads generating sections missing from the cache")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Collapse concurrent identical section fetches into one call.
+
+When several threads (batch workers, engine sections, service requests) ask
+for the same key while a fetch for it is already running, they wait on the
+leader's ``Future`` instead of sending their own OpenRouter request. Every
+waiter gets the leader's result or exception; the key is released as soon
+as the call finishes, so later requests go through the response cache as
+usual.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; safe to share between threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return ``fn(*args, **kwargs)``, sharing it with concurrent callers of ``key``."""
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            logger.debug("joining in-flight call for %s", key)
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._flights)
+
+    def metrics(self):
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._flights)}
+
+
+_flights = None
+_flights_lock = threading.Lock()
+
+
+def get_flights():
+    """The process-wide ``SingleFlight`` used by ``parsing.sections``."""
+    global _flights
+    with _flights_lock:
+        if _flights is None:
+            _flights = SingleFlight()
+        return _flights
@@ -0,0 +1,363 @@
+"""Versioned local store of company profiles.
+
+Every save appends a new version of the company's profile together with
+per-section metadata (when the section was fetched, from which template
+version and model) and the diff against the previous version. The latest
+version of each company is also indexed by the fields in ``INDEXED_FIELDS``,
+word by word, so filters like "uses Kafka and hires in Bangalore" are a
+lookup instead of a prompt and match "Apache Kafka" and "Bangalore,
+Karnataka":
+
+    python -m parsing.store query --tech kafka --city bangalore
+    python -m parsing.store show meta --section core
+    python -m parsing.store history meta
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from parsing import client, templates
+from parsing.cache import CACHE_DIR
+from parsing.canonical import canonical_name, name_key
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "profiles.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    company_key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    company TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    profile TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    diff TEXT,
+    PRIMARY KEY (company_key, version)
+);
+CREATE TABLE IF NOT EXISTS profile_fields (
+    company_key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (field, value, company_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_fields_company ON profile_fields (company_key);
+CREATE TABLE IF NOT EXISTS profile_terms (
+    company_key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (field, term, company_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS profile_terms_company ON profile_terms (company_key);
+"""
+
+# Field name -> (section, path). ``[]`` walks every item of an array and
+# ``*`` every value of an object.
+INDEXED_FIELDS = {
+    "industry": ("core", "basicIdentity.industry"),
+    "headquarters": ("core", "basicIdentity.headquarters"),
+    "city": ("jobs", "jobTrends.topLocations[].city"),
+    "tech": ("tech", "*.categories[].tags[]"),
+}
+
+TERM = re.compile(r"[^\s,;/()|]+")
+
+StoredProfile = namedtuple("StoredProfile", "company version created_at profile meta diff")
+
+
+def company_key(company):
+    return name_key(canonical_name(company))
+
+
+def index_value(value):
+    return " ".join(str(value).split()).lower()
+
+
+def index_terms(value):
+    """The words of an index value: "Menlo Park, California" gives menlo, park, california."""
+    terms = {term.strip(".-:") for term in TERM.findall(index_value(value))}
+    terms.discard("")
+    return terms
+
+
+def field_values(profile, field):
+    """The distinct index values of ``field`` in a ``{section: data}`` profile."""
+    section, path = INDEXED_FIELDS[field]
+    nodes = [profile.get(section)]
+    for part in path.split("."):
+        many = part.endswith("[]")
+        part = part[:-2] if many else part
+        if part == "*":
+            nodes = [value for node in nodes if isinstance(node, dict) for value in node.values()]
+        else:
+            nodes = [node.get(part) for node in nodes if isinstance(node, dict)]
+        if many:
+            nodes = [item for node in nodes if isinstance(node, list) for item in node]
+    values = {index_value(node) for node in nodes
+              if isinstance(node, (str, int, float)) and not isinstance(node, bool)}
+    values.discard("")
+    return values
+
+
+def section_meta(section, model=client.MODEL, fetched_at=None):
+    """Metadata stored alongside a freshly fetched section."""
+    return {"fetchedAt": time.time() if fetched_at is None else fetched_at,
+            "templateVersion": templates.version(section), "model": model}
+
+
+def diff_values(old, new, path=""):
+    """List the changes between two JSON values as ``{"path", "op", ...}`` dicts.
+
+    Objects are compared key by key; arrays and scalars are compared whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in old.keys() | new.keys():
+            sub_path = f"{path}.{key}" if path else key
+            if key not in new:
+                changes.append({"path": sub_path, "op": "remove", "old": old[key]})
+            elif key not in old:
+                changes.append({"path": sub_path, "op": "add", "new": new[key]})
+            else:
+                changes.extend(diff_values(old[key], new[key], sub_path))
+        return sorted(changes, key=lambda change: change["path"])
+    if old != new:
+        return [{"path": path, "op": "change", "old": old, "new": new}]
+    return []
+
+
+class ProfileStore:
+    """SQLite-backed profile history, safe to share between threads."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        has_terms = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'profile_terms'"
+        ).fetchone()
+        self._db.executescript(SCHEMA)
+        if not has_terms:
+            # Stores written before word-level indexing.
+            self.reindex()
+
+    def latest(self, company):
+        """The newest ``StoredProfile`` for ``company``, or ``None``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT company, version, created_at, profile, meta, diff FROM profiles "
+                "WHERE company_key = ? ORDER BY version DESC LIMIT 1",
+                (company_key(company),),
+            ).fetchone()
+        return None if row is None else _stored(row)
+
+    def history(self, company):
+        """Every version of ``company``, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT company, version, created_at, profile, meta, diff FROM profiles "
+                "WHERE company_key = ? ORDER BY version",
+                (company_key(company),),
+            ).fetchall()
+        return [_stored(row) for row in rows]
+
+    def companies(self):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT company FROM profiles p WHERE version = "
+                "(SELECT MAX(version) FROM profiles WHERE company_key = p.company_key) "
+                "ORDER BY company_key"
+            ).fetchall()
+        return [company for (company,) in rows]
+
+    def save(self, company, profile, meta):
+        """Append ``profile`` as the next version of ``company`` and return it.
+
+        ``meta`` maps each section to its ``fetchedAt``/``templateVersion``/
+        ``model``. The diff against the previous version is stored with it.
+        """
+        key = company_key(company)
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT version, profile FROM profiles WHERE company_key = ? "
+                    "ORDER BY version DESC LIMIT 1",
+                    (key,),
+                ).fetchone()
+                version, previous = (row[0] + 1, json.loads(row[1])) if row else (1, {})
+                diff = diff_values(previous, profile)
+                self._db.execute(
+                    "INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, version, company, time.time(), json.dumps(profile), json.dumps(meta),
+                     json.dumps(diff)),
+                )
+                self._index(key, profile)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return StoredProfile(company, version, time.time(), profile, meta, diff)
+
+    def update(self, company, sections, model=client.MODEL):
+        """Merge freshly fetched ``{section: data}`` into the latest version and save it."""
+        company = canonical_name(company)
+        stored = self.latest(company)
+        profile = dict(stored.profile) if stored else {}
+        meta = dict(stored.meta) if stored else {}
+        now = time.time()
+        for section, data in sections.items():
+            profile[section] = data
+            meta[section] = section_meta(section, model, now)
+        return self.save(stored.company if stored else company, profile, meta)
+
+    def find(self, **filters):
+        """Companies whose latest profile matches every ``field=value`` filter.
+
+        A filter matches when each of its words (``index_terms``) appears in
+        that field, case-insensitively: ``find(tech="kafka", city="Bangalore")``
+        finds tags like "Apache Kafka" and cities like "Bangalore, Karnataka".
+        """
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"not an indexed field: {', '.join(sorted(unknown))}")
+        if not filters:
+            return self.companies()
+        terms = {field: sorted(index_terms(value)) for field, value in filters.items()}
+        if not all(terms.values()):
+            return []
+        query = " INTERSECT ".join(
+            f"SELECT company_key FROM profile_terms WHERE field = ? AND term IN "
+            f"({', '.join('?' * len(words))}) GROUP BY company_key HAVING COUNT(*) = ?"
+            for words in terms.values()
+        )
+        params = [item for field, words in terms.items()
+                  for item in (field, *words, len(words))]
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT company FROM profiles p WHERE company_key IN ({query}) AND version = "
+                "(SELECT MAX(version) FROM profiles WHERE company_key = p.company_key) "
+                "ORDER BY company_key",
+                params,
+            ).fetchall()
+        return [company for (company,) in rows]
+
+    def values(self, field):
+        """``(value, company count)`` pairs for an indexed field, most common first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT value, COUNT(*) FROM profile_fields WHERE field = ? "
+                "GROUP BY value ORDER BY COUNT(*) DESC, value",
+                (field,),
+            ).fetchall()
+
+    def reindex(self):
+        """Rebuild ``profile_fields`` from the latest version of every company."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT company_key, profile FROM profiles p WHERE version = "
+                    "(SELECT MAX(version) FROM profiles WHERE company_key = p.company_key)"
+                ).fetchall()
+                self._db.execute("DELETE FROM profile_fields")
+                self._db.execute("DELETE FROM profile_terms")
+                for key, profile in rows:
+                    self._index(key, json.loads(profile))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def _index(self, key, profile):
+        self._db.execute("DELETE FROM profile_fields WHERE company_key = ?", (key,))
+        self._db.execute("DELETE FROM profile_terms WHERE company_key = ?", (key,))
+        values = {field: field_values(profile, field) for field in INDEXED_FIELDS}
+        self._db.executemany(
+            "INSERT OR IGNORE INTO profile_fields VALUES (?, ?, ?)",
+            [(key, field, value) for field in values for value in values[field]],
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO profile_terms VALUES (?, ?, ?)",
+            [(key, field, term) for field in values for value in values[field]
+             for term in index_terms(value)],
+        )
+
+
+def _stored(row):
+    company, version, created_at, profile, meta, diff = row
+    return StoredProfile(company, version, created_at, json.loads(profile), json.loads(meta),
+                         json.loads(diff) if diff else None)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The process-wide ``ProfileStore``."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ProfileStore()
+        return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    query = commands.add_parser("query", help="companies matching every given field")
+    for field in INDEXED_FIELDS:
+        query.add_argument(f"--{field}")
+    values = commands.add_parser("values", help="most common values of an indexed field")
+    values.add_argument("field", choices=list(INDEXED_FIELDS))
+    values.add_argument("--limit", type=int, default=20)
+    show = commands.add_parser("show", help="print a stored profile")
+    show.add_argument("company")
+    show.add_argument("--version", type=int)
+    show.add_argument("--section")
+    history = commands.add_parser("history", help="list the versions of a company")
+    history.add_argument("company")
+    commands.add_parser("reindex", help="rebuild the field indexes")
+    args = parser.parse_args()
+
+    store = get_store()
+    if args.command == "query":
+        filters = {field: getattr(args, field) for field in INDEXED_FIELDS
+                   if getattr(args, field)}
+        started = time.perf_counter()
+        companies = store.find(**filters)
+        for company in companies:
+            print(company)
+        print(f"{len(companies)} companies in {(time.perf_counter() - started) * 1000:.1f} ms")
+    elif args.command == "values":
+        for value, count in store.values(args.field)[:args.limit]:
+            print(f"{count:>6}  {value}")
+    elif args.command == "show":
+        versions = store.history(args.company)
+        if args.version is not None:
+            versions = [stored for stored in versions if stored.version == args.version]
+        if not versions:
+            raise SystemExit(f"no stored profile for {args.company}")
+        profile = versions[-1].profile
+        print(json.dumps(profile.get(args.section) if args.section else profile, indent=2))
+    elif args.command == "history":
+        for stored in store.history(args.company):
+            fetched = time.strftime("%Y-%m-%d %H:%M", time.localtime(stored.created_at))
+            changes = len(stored.diff or [])
+            print(f"v{stored.version}  {fetched}  {changes} changed fields  "
+                  f"sections: {', '.join(sorted(stored.profile))}")
+    elif args.command == "reindex":
+        print(f"reindexed {store.reindex()} companies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Incremental parsing of streamed completions.
+
+``TopLevelParser`` is fed the text deltas of a streamed completion and hands
+back each top-level member of the JSON object (``basicIdentity``,
+``overview``, ...) the moment its closing bracket arrives, so consumers can
+render or store the first blocks while the model is still writing the rest.
+
+    python -m parsing.stream core meta
+"""
+
+import argparse
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TopLevelParser:
+    """Single-pass scanner that splits a streamed JSON object into its members.
+
+    Any prose or code fence before the opening ``{`` is skipped. Only string
+    state and bracket depth are tracked while scanning; a member is decoded
+    with ``json.loads`` once, when the depth-1 ``,`` or closing ``}`` after it
+    is seen.
+    """
+
+    def __init__(self):
+        self.result = {}
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+
+    def feed(self, chunk):
+        """Consume ``chunk`` and return the ``(key, value)`` members it completed."""
+        if self.done:
+            return []
+        self._text += chunk
+        completed = []
+        text = self._text
+        i = self._pos
+        while i < len(text):
+            char = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._member_start is None:
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = i + 1
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(text[self._member_start:i], completed)
+                    self.done = True
+                    break
+            elif char == "," and self._depth == 1:
+                self._emit(text[self._member_start:i], completed)
+                self._member_start = i + 1
+            i += 1
+
+        # Drop everything already emitted so long completions stay cheap to scan.
+        if self._member_start is not None and not self.done:
+            self._text = text[self._member_start:]
+            self._pos = i - self._member_start
+            self._member_start = 0
+        else:
+            self._text = ""
+            self._pos = 0
+        return completed
+
+    def _emit(self, member, completed):
+        if not member.strip():
+            return
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError as exc:
+            logger.warning("skipping malformed member %.60r: %s", member.strip(), exc)
+            return
+        for key, value in parsed.items():
+            self.result[key] = value
+            completed.append((key, value))
+
+
+def main():
+    from parsing.sections import SECTIONS, stream_section
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("section", choices=list(SECTIONS))
+    parser.add_argument("company")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    for key, value in stream_section(args.section, args.company):
+        print(f"\n=== {key} ({time.perf_counter() - start:.1f}s) ===")
+        print(json.dumps(value, indent=2))
+
+
+if __name__ == "__main__":
+    main()
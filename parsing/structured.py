@@ -0,0 +1,185 @@
+"""Structured-output requests that send the section schema as a JSON Schema.
+
+The registry templates paste a long example JSON into every prompt and ask
+for that "EXACT JSON structure"; models then wrap the answer in prose and
+fences. In structured mode the example is compiled into a JSON Schema and
+sent through OpenRouter's ``response_format``, with a short instruction as
+the prompt. Field guidance that matters ("in 100 words atleast", "Score out
+of 5") stays as schema descriptions, and sub-objects that repeat (every
+``tech`` block's ``categories``) are shared through ``$defs``. The schema
+is not strict and lists no ``required`` keys, which keeps it smaller than
+the template; missing fields are caught by ``parsing.schema.validate`` and
+``--repair`` as before. Models that reject ``response_format`` are
+remembered and fall back to the template prompt:
+
+    python -m parsing.structured schema tech
+    python -m parsing.structured tokens
+"""
+
+import argparse
+import json
+import logging
+import threading
+from functools import lru_cache
+from string import Template
+
+from parsing import client, templates
+from parsing.extract import extract_json
+from parsing.schema import OPTIONAL_MARKER, section_schema
+
+logger = logging.getLogger(__name__)
+
+STRUCTURED_PROMPT = Template(
+    "Provide the ${title} of ${companyName} as one JSON object matching the response "
+    "schema. Use real, current information from official sources, specific to "
+    "${companyName}; follow each field's description, and use empty strings or arrays "
+    "for anything you cannot verify."
+)
+# Descriptions shorter than this only restate the key ("Conversion rate
+# percentage") and are dropped.
+MIN_DESCRIPTION_WORDS = 5
+UNSUPPORTED_HINTS = ("response_format", "json_schema", "structured", "support")
+
+_unsupported = set()
+_unsupported_lock = threading.Lock()
+
+
+def _compile(shape):
+    if isinstance(shape, dict):
+        return {"type": "object",
+                "properties": {key: _compile(sub) for key, sub in shape.items()}}
+    if isinstance(shape, list):
+        return {"type": "array", "items": _compile(shape[0]) if shape else {"type": "string"}}
+    compiled = {"type": "string"}
+    description = str(shape).replace(OPTIONAL_MARKER, "").strip()
+    if len(description.split()) >= MIN_DESCRIPTION_WORDS:
+        compiled["description"] = description
+    return compiled
+
+
+def _share_repeats(schema):
+    """Move object schemas that occur more than once into ``$defs``."""
+    counts = {}
+
+    def count(node):
+        if isinstance(node, dict):
+            if node.get("type") == "object":
+                key = json.dumps(node, sort_keys=True)
+                counts[key] = counts.get(key, 0) + 1
+            for value in node.values():
+                count(value)
+
+    count(schema)
+    defs = {}
+    names = {}
+
+    def replace(node, name):
+        if not isinstance(node, dict):
+            return node
+        key = json.dumps(node, sort_keys=True) if node.get("type") == "object" else None
+        if key is not None and counts[key] > 1:
+            if key not in names:
+                names[key] = def_name = name if name not in defs else f"{name}{len(defs)}"
+                defs[def_name] = None  # reserve the name before nested repeats
+                defs[def_name] = _rebuild(node)
+            return {"$ref": f"#/$defs/{names[key]}"}
+        return _rebuild(node)
+
+    def _rebuild(node):
+        rebuilt = dict(node)
+        if "properties" in node:
+            rebuilt["properties"] = {k: replace(v, k) for k, v in node["properties"].items()}
+        if "items" in node:
+            rebuilt["items"] = replace(node["items"], "item")
+        return rebuilt
+
+    compiled = _rebuild(schema)
+    if defs:
+        compiled["$defs"] = defs
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def section_json_schema(section):
+    """The JSON Schema compiled from ``section``'s example JSON."""
+    return _share_repeats(_compile(section_schema(section)))
+
+
+def response_format(section):
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": f"{section}_section", "strict": False,
+                        "schema": section_json_schema(section)},
+    }
+
+
+def structured_prompt(section, company):
+    from parsing.sections import SECTIONS
+
+    return STRUCTURED_PROMPT.substitute(title=SECTIONS[section].TITLE, companyName=company)
+
+
+def request_tokens(section, company="the company"):
+    """Estimated prompt tokens of a structured request, schema included."""
+    schema = json.dumps(response_format(section), separators=(",", ":"))
+    return templates.estimate_tokens(structured_prompt(section, company) + schema)
+
+
+def supports(model):
+    with _unsupported_lock:
+        return model not in _unsupported
+
+
+def unsupported_error(exc):
+    """True if ``exc`` is OpenRouter refusing ``response_format`` for the model."""
+    if not isinstance(exc, client.OpenRouterError) or exc.status not in (400, 404, 422):
+        return False
+    message = str(exc).lower()
+    return any(hint in message for hint in UNSUPPORTED_HINTS)
+
+
+def fetch_structured(section, company, model, labels, fallback):
+    """Fetch ``section`` with structured output, or through ``fallback(prompt, labels)``.
+
+    ``fallback`` is used with the registry template when ``model`` does not
+    support ``response_format``; the model is then skipped for the rest of
+    the process.
+    """
+    if supports(model):
+        try:
+            content = client.chat(structured_prompt(section, company), model,
+                                  {**labels, "kind": "structured"},
+                                  response_format=response_format(section))
+        except client.OpenRouterError as exc:
+            if not unsupported_error(exc):
+                raise
+            logger.info("%s does not support structured output, using the template: %s",
+                        model, exc)
+            with _unsupported_lock:
+                _unsupported.add(model)
+        else:
+            return extract_json(content)
+    return fallback(templates.render(section, company), labels)
+
+
+def main():
+    from parsing.sections import SECTIONS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    show = commands.add_parser("schema", help="print a section's compiled JSON Schema")
+    show.add_argument("section", choices=list(SECTIONS))
+    commands.add_parser("tokens", help="compare template and structured prompt tokens")
+    args = parser.parse_args()
+
+    if args.command == "schema":
+        print(json.dumps(section_json_schema(args.section), indent=2, ensure_ascii=False))
+        return
+    print(f"{'section':<10} {'template':>9} {'structured':>11}")
+    for section in SECTIONS:
+        print(f"{section:<10} {templates.prompt_tokens(section):>9} "
+              f"{request_tokens(section):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Prompt template registry shared with the mobile app.
+
+``prompts/templates.json`` holds one template per section, stored as a list
+of lines with a ``${companyName}`` placeholder. ``api/prompts.js`` and the
+Python pipeline both fill prompts in from it, so the two can no longer drift.
+Each entry also records a ``version`` (a hash of the template text, used in
+cache keys) and a precomputed token estimate, so the prompt budget of a
+call is known before it is sent.
+
+After editing a template, refresh its version and token count with:
+
+    python -m parsing.templates build
+    python -m parsing.templates check
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+from functools import lru_cache
+from string import Template
+
+REGISTRY_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "prompts", "templates.json"
+)
+
+_TOKEN_PIECES = re.compile(r" ?[A-Za-z]+| ?\d{1,3}| ?[^\sA-Za-z\d]+|\s+")
+
+
+def estimate_tokens(text):
+    """Rough BPE-style token count: word pieces of up to four characters."""
+    return sum(math.ceil(len(piece.strip() or piece) / 4)
+               for piece in _TOKEN_PIECES.findall(text))
+
+
+def template_version(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def _read_registry():
+    with open(REGISTRY_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_registry():
+    """``{section: {"version", "tokens", "template"}}`` with templates joined."""
+    registry = _read_registry()
+    for entry in registry.values():
+        entry["template"] = "\n".join(entry["template"])
+    return registry
+
+
+def template(section):
+    return load_registry()[section]["template"]
+
+
+def version(section):
+    return load_registry()[section]["version"]
+
+
+def prompt_tokens(section):
+    """Token estimate of the unfilled template (the company name adds a few)."""
+    return load_registry()[section]["tokens"]
+
+
+def render(section, company):
+    return Template(template(section)).substitute(companyName=company)
+
+
+def build():
+    """Recompute every entry's version and token estimate in place."""
+    registry = _read_registry()
+    for entry in registry.values():
+        text = "\n".join(entry["template"])
+        entry["version"] = template_version(text)
+        entry["tokens"] = estimate_tokens(text)
+    with open(REGISTRY_PATH, "w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def stale_entries():
+    """Sections whose stored version or token count no longer match the text."""
+    stale = []
+    for section, entry in load_registry().items():
+        if (entry["version"] != template_version(entry["template"])
+                or entry["tokens"] != estimate_tokens(entry["template"])):
+            stale.append(section)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["build", "check", "list"])
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build()
+    elif args.command == "check":
+        stale = stale_entries()
+        if stale:
+            raise SystemExit(f"stale registry entries, run build: {', '.join(stale)}")
+    else:
+        for section, entry in load_registry().items():
+            print(f"{section:<10} {entry['version']}  ~{entry['tokens']} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+
+# parsing reads these at import time: keep every store in a scratch directory
+# and never archive, rate-limit or require a key while testing.
+os.environ["INSIDER_CACHE_DIR"] = tempfile.mkdtemp(prefix="insider-tests-")
+os.environ["INSIDER_ARCHIVE"] = "0"
+os.environ["INSIDER_RATE_PER_MINUTE"] = "0"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,45 @@
+import os
+
+from parsing.archive import ResponseArchive, replay
+
+LABELS = {"company": "Acme", "section": "news"}
+
+
+def test_append_get_and_scan(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+    ids = [archive.append('{"headlines": [%d]}' % i, "model", LABELS) for i in range(5)]
+    assert archive.get(ids[3])["content"] == '{"headlines": [3]}'
+    assert [record["content"] for record in archive.scan()] == [
+        '{"headlines": [%d]}' % i for i in range(5)
+    ]
+    assert archive.stats()["records"] == 5
+
+
+def test_segments_rotate(tmp_path):
+    archive = ResponseArchive(str(tmp_path), segment_bytes=600)
+    for i in range(20):
+        archive.append("x" * 50 + str(i), "model", LABELS)
+    assert archive.stats()["segments"] > 1
+    assert len(list(archive.scan())) == 20
+    assert archive.get(20)["content"].endswith("19")
+
+
+def test_orphan_bytes_are_overwritten(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+    archive.append("one", "model", LABELS)
+    with open(os.path.join(str(tmp_path), "segment-000001.log"), "ab") as f:
+        f.write(b"bytes from an append that never committed")
+    second = archive.append("two", "model", LABELS)
+    assert archive.get(second)["content"] == "two"
+    assert [record["content"] for record in archive.scan()] == ["one", "two"]
+
+
+def test_replay_skips_fragments(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+    archive.append('{"headlines": []}', "model", LABELS)
+    archive.append('{"headlines": []}', "model", {**LABELS, "kind": "repair"})
+    archive.append("no json", "model", LABELS)
+    counts = replay(archive.scan())
+    assert counts["skipped"] == 1
+    assert counts["parse_failures"] == 1
+    assert counts["ok"] + counts["schema_issues"] == 1
@@ -0,0 +1,15 @@
+import pytest
+
+from parsing.batch import read_companies
+
+
+@pytest.mark.parametrize("filename, text", [
+    ("companies.csv", "name,domain\nMeta,meta.com\nAcme,acme.com\n"),
+    ("companies.csv", "domain,Company\nmeta.com,Meta\nacme.com, Acme \n"),
+    ("companies.csv", "Meta\nAcme\n\n"),
+    ("companies.jsonl", '{"name": "Meta"}\n\n{"company": "Acme", "name": "Acme Inc"}\n'),
+])
+def test_read_companies(tmp_path, filename, text):
+    path = tmp_path / filename
+    path.write_text(text, encoding="utf-8")
+    assert read_companies(str(path)) == ["Meta", "Acme"]
@@ -0,0 +1,42 @@
+import time
+
+from parsing.cache import ResponseCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return ResponseCache(str(tmp_path / "responses.sqlite3"), **kwargs)
+
+
+def test_put_then_get(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("Acme", "news", "model", "v1", {"headlines": []})
+    assert cache.get("Acme", "news", "model", "v1") == {"headlines": []}
+
+
+def test_key_includes_model_and_template_version(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("Acme", "news", "model", "v1", {"a": 1})
+    assert cache.get("Acme", "news", "other-model", "v1") is None
+    assert cache.get("Acme", "news", "model", "v2") is None
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = make_cache(tmp_path, ttls={"news": 0.05})
+    cache.put("Acme", "news", "model", "v1", {"a": 1})
+    time.sleep(0.1)
+    assert cache.get("Acme", "news", "model", "v1") is None
+    assert cache.stats().get("news", (0, 0))[0] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put("A", "news", "model", "v1", 1)
+    time.sleep(0.01)
+    cache.put("B", "news", "model", "v1", 2)
+    time.sleep(0.01)
+    cache.get("A", "news", "model", "v1")
+    time.sleep(0.01)
+    cache.put("C", "news", "model", "v1", 3)
+    assert cache.get("B", "news", "model", "v1") is None
+    assert cache.get("A", "news", "model", "v1") == 1
+    assert cache.get("C", "news", "model", "v1") == 3
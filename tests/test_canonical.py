@@ -0,0 +1,46 @@
+from parsing.canonical import ALIAS, EXACT, FUZZY, NEW, CompanyResolver, name_key
+
+ALIASES = {"Meta": ["Facebook", "Meta Platforms"], "Salesforce": ["Salesforce.com"],
+           "Microsoft": []}
+
+
+def test_name_key_drops_case_punctuation_and_suffixes():
+    assert name_key("Meta Platforms, Inc.") == "meta platforms"
+    assert name_key("JP Morgan Chase & Co.") == "jp morgan chase"
+
+
+def test_aliases_and_exact_names():
+    resolver = CompanyResolver(ALIASES)
+    assert resolver.resolve("facebook inc").how == ALIAS
+    assert resolver.resolve("Facebook").name == "Meta"
+    assert resolver.resolve("META").how == EXACT
+
+
+def test_transposition_typo_matches_the_alias_table():
+    match = CompanyResolver(ALIASES).resolve("Microsfot")
+    assert (match.name, match.how) == ("Microsoft", FUZZY)
+
+
+def test_one_letter_difference_is_a_different_company():
+    resolver = CompanyResolver(ALIASES)
+    assert resolver.resolve("Salesforge") == ("Salesforge", NEW, 0.0)
+
+
+def test_runtime_names_are_not_fuzzy_targets():
+    resolver = CompanyResolver(ALIASES)
+    assert resolver.resolve("Revolt").how == NEW
+    assert resolver.resolve("Revolut").name == "Revolut"
+    assert resolver.resolve("revolt").how == EXACT
+    resolver.resolve("Snowflakes")
+    assert resolver.resolve("Snowflake").name == "Snowflake"
+
+
+def test_cached_names_only_match_exactly():
+    resolver = CompanyResolver({})
+    resolver.add("Revolt", curated=False)
+    assert resolver.resolve("Revolut").name == "Revolut"
+
+
+def test_digits_must_match():
+    resolver = CompanyResolver({"Company 12": []})
+    assert resolver.resolve("Company 1").name == "Company 1"
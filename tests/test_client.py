@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from parsing import client
+
+
+def test_real_endpoint_requires_an_api_key():
+    with pytest.raises(client.OpenRouterError, match="OPENROUTER_API_KEY"):
+        client.OpenRouterClient(api_key=None)
+
+
+def test_other_endpoints_need_no_key():
+    mock = client.OpenRouterClient(url="http://127.0.0.1:1/", api_key=None)
+    assert "Authorization" not in mock.session.headers
+    keyed = client.OpenRouterClient(api_key="sk-test")
+    assert keyed.session.headers["Authorization"] == "Bearer sk-test"
+
+
+def test_overridden_url_needs_no_key():
+    """The offline workflow points OPENROUTER_URL at the mock server without a key."""
+    url = "http://127.0.0.1:8080/api/v1/chat/completions"
+    env = dict(os.environ, OPENROUTER_URL=url)
+    env.pop("OPENROUTER_API_KEY", None)
+    script = "from parsing import client; print(client.OpenRouterClient().url)"
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == url
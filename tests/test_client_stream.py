@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from parsing import client
+from parsing.archive import ResponseArchive
+from parsing.bench.mock_server import MockConfig, serve
+from parsing.metrics import MetricsSink
+from parsing.sections import stream_section
+
+
+class QueueingLimiter:
+    """Keeps every request queued locally for ``seconds`` before letting it out."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def acquire(self, url, priority=None):
+        time.sleep(self.seconds)
+
+    def observe(self, url, status, headers, retry_after=None):
+        pass
+
+
+@pytest.fixture
+def mock_url():
+    server = serve(MockConfig(latency_ms=0, jitter_ms=0, chunk_interval_ms=0), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+@pytest.fixture
+def mock_client(tmp_path, mock_url):
+    sink = MetricsSink(":memory:")
+    archive = ResponseArchive(str(tmp_path / "archive"))
+    client.set_client(client.OpenRouterClient(url=mock_url, sink=sink, archive=archive))
+    yield sink, archive
+    client.set_client(None)
+
+
+def test_streamed_section_is_recorded_with_usage_and_archived(mock_client):
+    sink, archive = mock_client
+    blocks = dict(stream_section("news", "Acme", use_cache=False))
+    assert blocks
+    (row,) = sink.rows()
+    assert row["status"] == "ok"
+    assert row["prompt_tokens"] and row["completion_tokens"]
+    assert archive.stats()["records"] == 1
+
+
+def test_consumer_hanging_up_after_the_last_block_is_ok(mock_client):
+    sink, archive = mock_client
+    stream = stream_section("news", "Acme", use_cache=False)
+    expected = len(dict(stream_section("news", "Acme", use_cache=False)))
+    for count, _block in enumerate(stream, 1):
+        if count == expected:
+            stream.close()
+            break
+    assert [row["status"] for row in sink.rows()] == ["ok", "ok"]
+    assert archive.stats()["records"] == 2
+
+
+def test_consumer_hanging_up_early_is_closed(mock_client):
+    sink, archive = mock_client
+    stream = stream_section("news", "Acme", use_cache=False)
+    next(stream)
+    stream.close()
+    (row,) = sink.rows()
+    assert row["status"] == "closed"
+    assert archive.stats()["records"] == 0
+
+
+def test_rate_limiter_wait_is_not_model_latency(mock_url):
+    sink = MetricsSink(":memory:")
+    queued = client.OpenRouterClient(url=mock_url, sink=sink, limiter=QueueingLimiter(0.5))
+    started = time.perf_counter()
+    queued.chat("Acme news", labels={"section": "news"})
+    list(queued.stream_chat("Acme news", labels={"section": "news"}))
+    assert time.perf_counter() - started >= 1.0
+    for row in sink.rows():
+        assert row["status"] == "ok"
+        assert row["total_ms"] < 400 and row["ttfb_ms"] < 400
@@ -0,0 +1,27 @@
+import time
+
+import pytest
+
+from parsing.export import export
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+
+NEWS = {
+    "headlines": [{"title": "Acme raises $40B", "date": "2024-05-01"}],
+}
+
+
+@pytest.mark.parametrize("fmt, suffix", [("parquet", ".parquet"), ("arrow", ".arrow")])
+def test_export_writes_partitioned_files(tmp_path, fmt, suffix):
+    written = export([("Acme", "news", time.time(), NEWS)], str(tmp_path), fmt, part="0")
+    (path, rows), = written.items()
+    assert rows == 1
+    assert path.endswith(suffix)
+    assert "section=news" in path and "fetch_date=" in path
+    if fmt == "parquet":
+        table = pa.parquet.read_table(path)
+    else:
+        table = pa.feather.read_table(path)
+    assert table.num_rows == 1
+    assert table.column("company").to_pylist() == ["Acme"]
@@ -0,0 +1,50 @@
+import pytest
+
+from parsing.extract import ExtractionError, extract_json, repair_json
+
+
+def test_fenced_reply_with_prose():
+    reply = 'Here is the data for {company}:\n```json\n{"a": 1}\n```\nHope this helps!'
+    assert extract_json(reply) == {"a": 1}
+
+
+def test_unfenced_reply_with_trailing_prose():
+    assert extract_json('{"a": {"b": [1, 2]}} Let me know if you need more.') == {
+        "a": {"b": [1, 2]}
+    }
+
+
+def test_trailing_commas():
+    assert extract_json('{"a": [1, 2,], "b": {"c": 3,},}') == {"a": [1, 2], "b": {"c": 3}}
+
+
+def test_smart_quotes():
+    assert extract_json("{“a”: “x”}") == {"a": "x"}
+
+
+def test_raw_newline_in_string():
+    assert extract_json('{"a": "line1\nline2"}') == {"a": "line1\nline2"}
+
+
+def test_mismatched_closer():
+    assert extract_json('{"a": [1, 2}') == {"a": [1, 2]}
+
+
+def test_truncated_reply_is_closed():
+    data = extract_json('```json\n{"a": 1, "b": [1, 2], "c": "cut of')
+    assert data["a"] == 1
+    assert data["b"] == [1, 2]
+    assert data["c"].startswith("cut")
+
+
+def test_no_object():
+    with pytest.raises(ExtractionError):
+        extract_json("Sorry, I cannot help with that.")
+
+
+def test_repair_json_gives_up_on_garbage():
+    assert repair_json("not json at all") is None
+
+
+def test_repair_json_keeps_complete_members():
+    assert repair_json('{"a": 1, "b": ')["a"] == 1
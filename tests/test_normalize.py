@@ -0,0 +1,89 @@
+import pytest
+
+from parsing.normalize import (
+    COUNT, CURRENCY, PERCENT, STRING, YEAR, Normalizer, leaf_kind, parse_quantity,
+)
+from parsing.schema import section_schema
+from parsing.sections import SECTIONS
+
+
+@pytest.mark.parametrize("text, value, low, high, unit, approx", [
+    ("70,000+", 70000, 70000, 70000, None, True),
+    ("~85%", 85, 85, 85, "%", True),
+    ("10-15", 12.5, 10, 15, None, False),
+    ("4.2/5", 4.2, 4.2, 4.2, None, False),
+    ("$1.2-1.5B", 1.35e9, 1.2e9, 1.5e9, "USD", False),
+    ("₹500 Cr", 5e9, 5e9, 5e9, "INR", False),
+    ("50.5%–60%", 55.25, 50.5, 60, "%", False),
+    ("50.5% - 60", 55.25, 50.5, 60, "%", False),
+    ("about 2 million", 2e6, 2e6, 2e6, None, True),
+    ("Rs. 12 LPA", 1.2e6, 1.2e6, 1.2e6, "INR", False),
+    ("₹8-10 lakh per annum", 9e5, 8e5, 1e6, "INR", False),
+])
+def test_parse_quantity(text, value, low, high, unit, approx):
+    quantity = parse_quantity(text)
+    assert quantity.value == pytest.approx(value)
+    assert (quantity.low, quantity.high) == (pytest.approx(low), pytest.approx(high))
+    assert quantity.unit == unit
+    assert quantity.approx == approx
+
+
+def test_parse_quantity_without_a_number():
+    assert parse_quantity("not disclosed") is None
+    assert parse_quantity(None) is None
+
+
+def test_currency_prefers_the_amount_next_to_the_mark():
+    assert parse_quantity("Q3 2024 revenue $40B").value == 3
+    quantity = parse_quantity("Q3 2024 revenue $40B", currency=True)
+    assert (quantity.value, quantity.unit) == (4e10, "USD")
+    assert parse_quantity("40B USD in Q3", currency=True).value == 4e10
+
+
+def test_normalizer_coerces_by_kind_and_memoises():
+    normalizer = Normalizer()
+    assert normalizer.coerce(PERCENT, "~85%") == 85
+    assert normalizer.coerce(COUNT, "1,200+") == 1200
+    assert normalizer.coerce(CURRENCY, "Q3 2024 revenue $40B") == {
+        "value": 4e10, "currency": "USD"
+    }
+    normalizer.coerce(COUNT, "1,200+")
+    assert normalizer.distinct == 3
+
+
+@pytest.mark.parametrize("text, year", [
+    ("2024-25", 2024),
+    ("FY 2023–24", 2023),
+    ("2019", 2019),
+    (2015, 2015),
+    ("Founded in 1998 by 2 engineers", 1998),
+    ("unknown", None),
+])
+def test_year_is_the_first_four_digit_number(text, year):
+    assert Normalizer().coerce(YEAR, text) == year
+
+
+def list_leaves(shape, path=""):
+    """``(path, description)`` of every list whose items are plain leaves."""
+    if isinstance(shape, dict):
+        for key, sub in shape.items():
+            yield from list_leaves(sub, f"{path}.{key}")
+    elif isinstance(shape, list) and shape:
+        if isinstance(shape[0], (dict, list)):
+            yield from list_leaves(shape[0], path + "[]")
+        else:
+            yield path + "[]", shape[0]
+
+
+@pytest.mark.parametrize("section", list(SECTIONS))
+def test_lists_of_free_text_stay_strings(section):
+    for path, description in list_leaves(section_schema(section), section):
+        assert leaf_kind(description) == STRING, (path, description)
+
+
+def test_employee_counts_are_counts_but_referral_steps_are_not():
+    assert leaf_kind("Total global employees") == COUNT
+    assert leaf_kind("Employees in India") == COUNT
+    steps = ["Message engineers on LinkedIn", "Ask alumni"]
+    data = Normalizer().normalize("ways", {"referrals": {"howToAsk": steps}})
+    assert data["referrals"]["howToAsk"] == steps
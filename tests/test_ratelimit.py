@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from parsing.ratelimit import BATCH, INTERACTIVE, SharedRateLimiter
+
+URL = "https://openrouter.ai/api/v1/chat/completions"
+HOST = "openrouter.ai"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "ratelimit.sqlite3")
+
+
+def test_limiters_on_one_path_share_a_bucket(path):
+    first = SharedRateLimiter(path, rate_per_minute=300)
+    second = SharedRateLimiter(path, rate_per_minute=300)
+    first.acquire(URL)
+    started = time.perf_counter()
+    second.acquire(URL)
+    assert time.perf_counter() - started >= 0.15
+
+
+def test_interactive_waiter_goes_ahead_of_queued_batch_waiters(path):
+    limiter = SharedRateLimiter(path, rate_per_minute=240)
+    limiter.acquire(URL)
+    served = []
+
+    def wait(name, priority):
+        limiter.acquire(URL, priority)
+        served.append(name)
+
+    threads = [threading.Thread(target=wait, args=(f"batch-{i}", BATCH)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    assert limiter.status()[HOST]["waiting"] == {BATCH: 3}
+    threads.append(threading.Thread(target=wait, args=("interactive", INTERACTIVE)))
+    threads[-1].start()
+    for thread in threads:
+        thread.join(5)
+    assert served[0] == "interactive"
+    assert sorted(served[1:]) == ["batch-0", "batch-1", "batch-2"]
+
+
+def test_429_halves_the_rate_and_blocks_until_retry_after(path):
+    limiter = SharedRateLimiter(path, rate_per_minute=20)
+    limiter.observe(URL, 429, {}, retry_after=30)
+    state = limiter.status()[HOST]
+    assert state["per_minute"] == 10
+    assert 29 <= state["blocked_for"] <= 30
+    limiter.observe(URL, 429, {"X-RateLimit-Reset": str((time.time() + 90) * 1000)})
+    state = limiter.status()[HOST]
+    assert state["per_minute"] == 5
+    assert 89 <= state["blocked_for"] <= 90
+
+
+def test_rate_limit_header_raises_the_ceiling(path):
+    limiter = SharedRateLimiter(path, rate_per_minute=20)
+    limiter.observe(URL, 200, {})
+    assert limiter.status()[HOST]["per_minute"] == 20
+    limiter.observe(URL, 200, {"X-RateLimit-Limit": "200"})
+    state = limiter.status()[HOST]
+    assert state["ceiling_per_minute"] == 200
+    assert state["per_minute"] == 21
+
+
+def test_spent_quota_blocks_until_reset(path):
+    limiter = SharedRateLimiter(path, rate_per_minute=20)
+    limiter.observe(URL, 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "45"})
+    assert 44 <= limiter.status()[HOST]["blocked_for"] <= 45
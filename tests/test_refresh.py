@@ -0,0 +1,41 @@
+import asyncio
+import sys
+
+import pytest
+
+from parsing import refresh
+from parsing.refresh import RefreshError, refresh_all
+from parsing.store import ProfileStore
+
+
+@pytest.fixture
+def failing_fetch(monkeypatch):
+    async def fetch_profile(company, sections, use_cache=True):
+        if company == "Broken":
+            return {"errors": {section: "OpenRouterError: HTTP 429" for section in sections}}
+        if company == "Crashing":
+            raise RuntimeError("boom")
+        return {section: {"ok": True} for section in sections}
+
+    monkeypatch.setattr(refresh, "fetch_profile", fetch_profile)
+
+
+def test_failures_are_not_reported_as_up_to_date(tmp_path, failing_fetch):
+    store = ProfileStore(str(tmp_path / "profiles.sqlite3"))
+    results = dict(asyncio.run(refresh_all(store, ["Broken", "Crashing", "Fine"])))
+    assert isinstance(results["Broken"], RefreshError)
+    assert isinstance(results["Crashing"], RuntimeError)
+    assert results["Fine"].version == 1
+    again = dict(asyncio.run(refresh_all(store, ["Fine"])))
+    assert again["Fine"] is None
+
+
+def test_main_exits_non_zero_when_a_refresh_fails(tmp_path, monkeypatch, capsys, failing_fetch):
+    monkeypatch.setattr(refresh, "get_store",
+                        lambda: ProfileStore(str(tmp_path / "profiles.sqlite3")))
+    monkeypatch.setattr(sys, "argv", ["refresh", "Broken", "Fine"])
+    with pytest.raises(SystemExit, match="1 of 2 companies failed"):
+        refresh.main()
+    out = capsys.readouterr().out
+    assert "Broken: failed (RefreshError" in out
+    assert "Fine: version 1" in out
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+import requests
+
+from parsing import client
+from parsing.sections import cached_section, fetch_section
+
+
+class FailingRepair:
+    """Answers the section prompt with a partial section and every repair with ``repair``."""
+
+    def __init__(self, repair):
+        self.repair = repair
+        self.calls = []
+
+    def chat(self, prompt, model=client.MODEL, labels=None, response_format=None):
+        self.calls.append(labels.get("kind", "section"))
+        if labels.get("kind") != "repair":
+            return json.dumps({"companyNews": []})
+        if isinstance(self.repair, Exception):
+            raise self.repair
+        return self.repair
+
+
+@pytest.fixture
+def stub_client():
+    def install(repair):
+        stub = FailingRepair(repair)
+        client.set_client(stub)
+        return stub
+    yield install
+    client.set_client(None)
+
+
+@pytest.mark.parametrize("company, repair", [
+    ("Rate Limited Co", client.OpenRouterError("HTTP 429: rate limited", 429)),
+    ("Timed Out Co", requests.Timeout("read timed out")),
+    ("Unparseable Co", "no json here"),
+])
+def test_failed_repair_keeps_and_caches_the_primary_section(stub_client, company, repair):
+    stub = stub_client(repair)
+    data = fetch_section("news", company, repair=True)
+    assert data == {"companyNews": []}
+    assert stub.calls == ["section", "repair"]
+    assert cached_section("news", company) == data
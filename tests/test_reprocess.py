@@ -0,0 +1,26 @@
+import os
+
+from parsing.normalize import Normalizer
+from parsing.reprocess import find_inputs, parse_record
+
+
+def test_fragments_are_skipped():
+    record = {"company": "Acme", "section": "jobs", "kind": "repair", "content": "{}"}
+    _out, outcome, data = parse_record(record, Normalizer())
+    assert (outcome, data) == ("skipped", None)
+
+
+def test_whole_sections_are_parsed():
+    record = {"company": "Acme", "section": "news", "kind": "stream",
+              "content": '```json\n{"headlines": []}\n```'}
+    out, outcome, data = parse_record(record, Normalizer())
+    assert outcome in ("ok", "schema_issues")
+    assert data == {"headlines": []}
+
+
+def test_output_directory_is_not_an_input(tmp_path):
+    (tmp_path / "raw.jsonl").write_text("")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "part-000000.jsonl").write_text("")
+    assert find_inputs(str(tmp_path), str(out_dir)) == [os.path.join(str(tmp_path), "raw.jsonl")]
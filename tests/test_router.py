@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from parsing import client
+from parsing.router import Router
+
+
+def row(status, kind="stream"):
+    return {"kind": kind, "model": "a", "section": "news", "status": status, "total_ms": 1000}
+
+
+def test_closed_streams_are_not_failures():
+    router = Router(["a", "b"])
+    router.load_history([row("ok"), row("closed"), row("closed"), row("error", "section")])
+    assert router.success_rate("a", "news") == 0.5
+
+
+class QueuedStreams:
+    """Streams ``{}`` after ``queue`` seconds on the rate limiter and ``latency`` in flight."""
+
+    def __init__(self, queue, latency):
+        self.queue = queue
+        self.latency = latency
+        self.models = []
+
+    def stream_chat(self, prompt, model, labels=None, complete=None, on_send=None):
+        self.models.append(model)
+        time.sleep(self.queue)
+        on_send()
+        time.sleep(self.latency)
+        yield "{}"
+
+
+@pytest.fixture
+def queued_streams():
+    stub = QueuedStreams(queue=0.5, latency=0.05)
+    client.set_client(stub)
+    yield stub
+    client.set_client(None)
+
+
+def test_rate_limiter_queueing_neither_hedges_nor_counts_as_latency(queued_streams):
+    router = Router(["a", "b"], hedge_delay=0.2)
+    assert router.fetch_json("prompt", "news") == ({}, "a")
+    assert queued_streams.models == ["a"]
+    (latency,) = router._latencies["a", "news"]
+    assert 0.05 <= latency < 0.2
@@ -0,0 +1,132 @@
+import asyncio
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from parsing import client, templates
+from parsing.bench.mock_server import MockConfig, serve
+from parsing.cache import get_cache
+from parsing.canonical import canonical_name
+from parsing.service import ProfileService
+
+NEWS = {"headlines": [{"title": "Acme ships %d widgets" % i} for i in range(50)]}
+
+
+# Mock replies at 1ms a token: culture is short, tech is a few hundred tokens
+# of prose that is not JSON and core takes over a second, so the misses
+# finish culture, tech, core.
+CORPUS = {
+    "culture": [json.dumps({"cultureOverview": "Flat"})],
+    "tech": ["I cannot help with that. " * 50],
+    "core": [json.dumps({"overview": "Acme makes everything. " * 250})],
+}
+
+
+def start_service(workers):
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    holder = {}
+
+    async def start():
+        server = await asyncio.start_server(ProfileService(workers).handle, "127.0.0.1", 0)
+        holder["port"] = server.sockets[0].getsockname()[1]
+        started.set()
+        await server.serve_forever()
+
+    threading.Thread(target=loop.run_until_complete, args=(start(),), daemon=True).start()
+    started.wait(5)
+    return holder["port"]
+
+
+@pytest.fixture(scope="module")
+def port():
+    company = canonical_name("Service Test Co")
+    get_cache().put(company, "news", client.MODEL, templates.version("news"), NEWS)
+    return start_service(workers=2)
+
+
+@pytest.fixture
+def mock_upstream():
+    mock = serve(MockConfig(latency_ms=0, jitter_ms=0, token_ms=1, corpus=CORPUS), port=0)
+    threading.Thread(target=mock.serve_forever, daemon=True).start()
+    client.set_client(client.OpenRouterClient(url=f"http://127.0.0.1:{mock.server_port}/"))
+    yield
+    client.set_client(None)
+    mock.shutdown()
+
+
+def get(port, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    return response.status, response.headers, response.read()
+
+
+def test_cached_section_with_etag_and_gzip(port):
+    status, headers, body = get(port, "/companies/service%20test%20co/news",
+                                {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert b"Acme ships 49 widgets" in gzip.decompress(body)
+    status, _headers, body = get(port, "/companies/Service%20Test%20Co/news",
+                                 {"If-None-Match": headers["ETag"]})
+    assert (status, body) == (304, b"")
+
+
+def test_unknown_section_and_route(port):
+    assert get(port, "/companies/acme/bogus")[0] == 404
+    assert get(port, "/nothing")[0] == 404
+
+
+def test_unreachable_upstream_is_bad_gateway(port):
+    client.set_client(client.OpenRouterClient(url="http://127.0.0.1:1/", max_retries=0))
+    try:
+        assert get(port, "/companies/Nowhere%20Ltd/news")[0] == 502
+    finally:
+        client.set_client(None)
+
+
+def events(port, path):
+    """``(event, data)`` for each server-sent event, and whether the body ended cleanly."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("GET", path)
+    response = connection.getresponse()
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("text/event-stream")
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    received = []
+    fields = {}
+    for line in iter(response.readline, b""):
+        line = line.decode("utf-8").rstrip("\n")
+        if line.startswith(":"):
+            continue
+        if line:
+            name, _, value = line.partition(": ")
+            fields[name] = value
+        elif fields:
+            received.append((fields["event"], json.loads(fields["data"])))
+            fields = {}
+    return received, response.isclosed()
+
+
+def test_events_stream_cached_then_completion_order(port, mock_upstream):
+    company = canonical_name("Events Test Co")
+    get_cache().put(company, "news", client.MODEL, templates.version("news"), NEWS)
+    path = "/companies/events%20test%20co/events?sections=core,tech,culture,news"
+    received, ended = events(start_service(workers=4), path)
+    assert [(event, data.get("section")) for event, data in received] == [
+        ("section", "news"), ("section", "culture"), ("error", "tech"), ("section", "core"),
+        ("done", None),
+    ]
+    assert received[0][1] == {"section": "news", "cached": True, "data": NEWS}
+    assert received[1][1]["cached"] is False
+    assert received[1][1]["data"] == {"cultureOverview": "Flat"}
+    assert received[-1][1]["sections"] == 3 and received[-1][1]["errors"] == 1
+    assert ended
+
+
+def test_events_for_unknown_sections(port):
+    assert get(port, "/companies/acme/events?sections=core,bogus")[0] == 404
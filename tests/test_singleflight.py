@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from parsing.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(flights.do, "key", slow, 21)
+        started.wait(5)
+        followers = [executor.submit(flights.do, "key", slow, 21) for _ in range(7)]
+        while flights.metrics()["shared"] < 7:
+            time.sleep(0.01)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == [42] * 8
+    assert calls == [21]
+    assert flights.metrics() == {"calls": 1, "shared": 7, "in_flight": 0}
+
+
+def test_followers_get_the_leaders_exception():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, "key", failing)
+        started.wait(5)
+        follower = executor.submit(flights.do, "key", failing)
+        while flights.metrics()["shared"] < 1:
+            time.sleep(0.01)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+    assert flights.in_flight() == 0
+
+
+def test_key_is_released_after_the_call():
+    flights = SingleFlight()
+    assert flights.do("key", lambda: 1) == 1
+    assert flights.do("key", lambda: 2) == 2
+    assert flights.metrics()["calls"] == 2
@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+
+from parsing.store import ProfileStore, index_terms
+
+ACME = {
+    "core": {"basicIdentity": {"industry": "Social Media",
+                               "headquarters": "Menlo Park, California, USA"}},
+    "jobs": {"jobTrends": {"topLocations": [{"city": "Bangalore, Karnataka"},
+                                            {"city": "New Delhi"}]}},
+    "tech": {"backend": {"categories": [{"tags": ["Apache Kafka", "Node.js"]}]}},
+}
+GLOBEX = {
+    "core": {"basicIdentity": {"industry": "Fintech", "headquarters": "London, UK"}},
+    "jobs": {"jobTrends": {"topLocations": [{"city": "Bangalore"}]}},
+    "tech": {"data": {"categories": [{"tags": ["Kafka Streams", "C++"]}]}},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.sqlite3"))
+    store.save("Acme", ACME, {})
+    store.save("Globex", GLOBEX, {})
+    return store
+
+
+def test_index_terms():
+    assert index_terms("Menlo Park, California, USA") == {"menlo", "park", "california", "usa"}
+    assert index_terms("Node.js / C++") == {"node.js", "c++"}
+
+
+@pytest.mark.parametrize("filters, companies", [
+    ({"tech": "kafka"}, ["Acme", "Globex"]),
+    ({"tech": "Apache Kafka"}, ["Acme"]),
+    ({"tech": "node.js"}, ["Acme"]),
+    ({"city": "bangalore"}, ["Acme", "Globex"]),
+    ({"city": "new delhi"}, ["Acme"]),
+    ({"headquarters": "Menlo Park"}, ["Acme"]),
+    ({"tech": "kafka", "city": "Bangalore", "industry": "fintech"}, ["Globex"]),
+    ({"tech": "rust"}, []),
+    ({"city": ""}, []),
+])
+def test_find_matches_words_of_a_field(store, filters, companies):
+    assert store.find(**filters) == companies
+
+
+def test_find_uses_only_the_latest_version(store):
+    store.save("Acme", dict(ACME, tech={}), {})
+    assert store.find(tech="kafka") == ["Globex"]
+
+
+def test_values_are_whole_values(store):
+    assert ("bangalore, karnataka", 1) in store.values("city")
+
+
+def test_old_stores_are_reindexed_on_open(store):
+    with sqlite3.connect(store.path) as db:
+        db.execute("DROP TABLE profile_terms")
+    assert ProfileStore(store.path).find(tech="kafka") == ["Acme", "Globex"]
+
+
+def test_unknown_field(store):
+    with pytest.raises(ValueError, match="not an indexed field"):
+        store.find(salary="high")
@@ -0,0 +1,51 @@
+import json
+
+from parsing.stream import TopLevelParser
+
+REPLY = """Sure! Here is the profile:
+```json
+{
+  "name": "Acme, Inc.",
+  "tags": ["a,b", "{not a block}", "quote \\" inside"],
+  "nested": {"x": [1, {"y": "}"}], "z": null},
+  "count": 3
+}
+```
+"""
+
+
+def feed_all(chunks):
+    parser = TopLevelParser()
+    members = []
+    for chunk in chunks:
+        members.extend(parser.feed(chunk))
+    return parser, members
+
+
+def test_members_match_the_whole_object():
+    expected = json.loads(REPLY[REPLY.index("{"):REPLY.rindex("}") + 1])
+    for size in (1, 3, 17, len(REPLY)):
+        parser, members = feed_all(REPLY[i:i + size] for i in range(0, len(REPLY), size))
+        assert parser.done
+        assert [key for key, _ in members] == list(expected)
+        assert parser.result == expected
+
+
+def test_member_is_emitted_when_the_next_one_starts():
+    parser = TopLevelParser()
+    assert parser.feed('{"a": [1, 2]') == []
+    assert parser.feed(', "b"') == [("a", [1, 2])]
+    assert parser.feed(": 2}") == [("b", 2)]
+    assert parser.done
+
+
+def test_feed_after_done_is_ignored():
+    parser, _ = feed_all(['{"a": 1}'])
+    assert parser.feed(', "b": 2}') == []
+    assert parser.result == {"a": 1}
+
+
+def test_malformed_member_is_skipped():
+    parser, members = feed_all(['{"a": 1, "b": nope, "c": 3}'])
+    assert members == [("a", 1), ("c", 3)]
+    assert parser.done